@@ -1,5 +1,15 @@
 import sys
 import argparse
+import heapq
+import random
+from bisect import bisect_left, insort
+from profiling import Profiler, PROFILE_MODES
+from cache import ResultCache, cache_key, source_digest
+from graph import find_interchangeable_classes, symmetry_predecessors
+from feasibility import DayWindows
+
+ORDERS = ('cp', 'prompts', 'unlocks', 'random', 'id')
+RESTART_NODES = 64  # first 'random' run may expand 64 × |assignments| nodes, doubled per restart
 
 def parse_input(filename):
     assignments = {}
@@ -37,17 +47,94 @@ def get_ready(completed, assignments):
     return [aid for aid, data in assignments.items() 
             if aid not in completed and data['deps'].issubset(completed)]
 
-def can_complete_mode1(assignments, N, K, M):
-    total = len(assignments)
+# Dependencies on IDs that are not in the input are skipped here: such an
+# assignment never becomes ready, so the probes report it as impossible.
+def dependents(assignments):
+    kids = {a: [] for a in assignments}
+    for aid, data in assignments.items():
+        for d in data['deps']:
+            if d in kids: kids[d].append(aid)
+    return kids
+
+# cp[a] = assignments on the longest dependency chain starting at a (None on a
+# cycle). Dependencies missing from the input do not count towards the chain.
+def critical_paths(assignments, kids):
+    wait = {a: sum(d in assignments for d in data['deps']) for a, data in assignments.items()}
+    order = [a for a in assignments if wait[a] == 0]
+    for a in order:
+        for c in kids[a]:
+            wait[c] -= 1
+            if wait[c] == 0: order.append(c)
+    if len(order) != len(assignments): return None
+    cp = {}
+    for a in reversed(order): cp[a] = 1 + max((cp[c] for c in kids[a]), default=0)
+    return cp
+
+# Value ordering of the probes. get_ready lists assignments in dict order, so a
+# static order is just the dict rebuilt in that order (no per-node sorting):
+# cp = longest remaining chain first, prompts = largest first, unlocks = most
+# dependents first (ties: larger prompts, then ID); id keeps input order.
+# 'random' keeps input order here; the probe reshuffles at every node.
+def branch_order(assignments, order):
+    if order in ('id', 'random'): return assignments
+    kids = dependents(assignments)
+    if order == 'cp':
+        cp = critical_paths(assignments, kids)
+        rank = lambda a: (-cp[a], -assignments[a]['prompts'], a)
+    elif order == 'prompts': rank = lambda a: (-assignments[a]['prompts'], a)
+    elif order == 'unlocks': rank = lambda a: (-len(kids[a]), -assignments[a]['prompts'], a)
+    else: raise ValueError(f"Unknown order '{order}', expected one of {ORDERS}")
+    return {a: assignments[a] for a in sorted(assignments, key=rank)}
+
+class Restart(Exception): pass
+
+# Runs search() to the end; with order 'random' a run that passes its node
+# budget is abandoned and restarted with a new shuffle and twice the budget,
+# so the probe stays complete. stats (optional dict) accumulates over every
+# probe that receives it: 'nodes', 'restarts', and for feasible probes
+# 'successes' / 'success_nodes' (nodes spent before the witness was found).
+def run_probe(search, nodes, limit, order, size, stats):
+    budget = RESTART_NODES * size if order == 'random' else float('inf')
+    restarts = 0
+    while True:
+        limit[0] = nodes[0] + budget
+        try:
+            found = search(); break
+        except Restart:
+            restarts, budget = restarts + 1, 2 * budget
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + nodes[0]
+        stats['restarts'] = stats.get('restarts', 0) + restarts
+        if found:
+            stats['successes'] = stats.get('successes', 0) + 1
+            stats['success_nodes'] = stats.get('success_nodes', 0) + nodes[0]
+    return found
+
+# Interchangeable assignments (graph.find_interchangeable_classes) are only
+# tried in ID order: twin maps each to the class member before it. States
+# where a chain no longer fits before day M are cut as each day starts
+# (feasibility.DayWindows): a day holds N*K prompts of a chain in mode 1, K in
+# mode 2 (same student).
+def can_complete_mode1(assignments, N, K, M, stats=None, order='cp', seed=0):
+    total, nodes, limit = len(assignments), [0], [0]
+    twin = symmetry_predecessors(find_interchangeable_classes(assignments))
+    windows = DayWindows(assignments, N * K, M)
+    assignments, shuffle = branch_order(assignments, order), random.Random(seed).shuffle
     def dfs(day, completed, remaining, today):
+        nodes[0] += 1
+        if nodes[0] > limit[0]: raise Restart
         if len(completed) == total: return True
-        if day > M: return False
-        for aid in get_ready(completed, assignments):
+        if day > M or not (today or windows.is_open(completed, day)): return False
+        ready = get_ready(completed, assignments)
+        if order == 'random': shuffle(ready)
+        for aid in ready:
+            if aid in twin and twin[aid] not in completed: continue
             fits, new_rem = can_fit(assignments[aid]['prompts'], remaining)
             if fits and dfs(day, completed | {aid}, new_rem, True): return True
         if today and dfs(day + 1, completed, tuple([K]*N), False): return True
         return False
-    return dfs(1, frozenset(), tuple([K]*N), False)
+    return run_probe(lambda: dfs(1, frozenset(), tuple([K]*N), False),
+                     nodes, limit, order, total, stats)
 
 def get_ready_mode2(completed, prev_done, assignments, student_done):
     ready = []
@@ -61,12 +148,20 @@ def get_ready_mode2(completed, prev_done, assignments, student_done):
             if allowed: ready.append((aid, allowed))
     return ready
 
-def can_complete_mode2(assignments, N, K, M):
-    total = len(assignments)
+def can_complete_mode2(assignments, N, K, M, stats=None, order='cp', seed=0):
+    total, nodes, limit = len(assignments), [0], [0]
+    twin = symmetry_predecessors(find_interchangeable_classes(assignments))
+    windows = DayWindows(assignments, K, M)
+    assignments, shuffle = branch_order(assignments, order), random.Random(seed).shuffle
     def dfs(day, completed, prev_done, remaining, student_done, today):
+        nodes[0] += 1
+        if nodes[0] > limit[0]: raise Restart
         if len(completed) == total: return True
-        if day > M: return False
-        for aid, allowed in get_ready_mode2(completed, prev_done, assignments, student_done):
+        if day > M or not (today or windows.is_open(completed, day)): return False
+        ready = get_ready_mode2(completed, prev_done, assignments, student_done)
+        if order == 'random': shuffle(ready)
+        for aid, allowed in ready:
+            if aid in twin and twin[aid] not in completed: continue
             p = assignments[aid]['prompts']
             for s in allowed:
                 if remaining[s] >= p:
@@ -76,26 +171,55 @@ def can_complete_mode2(assignments, N, K, M):
                     if dfs(day, completed | {aid}, prev_done, new_rem, new_sd, True): return True
         if today and dfs(day + 1, completed, completed, tuple([K]*N), {i: set() for i in range(N)}, False): return True
         return False
-    return dfs(1, frozenset(), frozenset(), tuple([K]*N), {i: set() for i in range(N)}, False)
+    return run_probe(lambda: dfs(1, frozenset(), frozenset(), tuple([K]*N), {i: set() for i in range(N)}, False),
+                     nodes, limit, order, total, stats)
+
+# Greedy list scheduling: longest critical path first, best-fit into students.
+# Mode 2 only starts work whose deps finished on earlier days, which is always
+# legal under next-day sharing. Returns the days of one valid schedule, or -1.
+def greedy_days(assignments, N, K, mode):
+    kids = dependents(assignments)
+    cp = critical_paths(assignments, kids)
+    if cp is None: return -1
+    key = lambda a: (-cp[a], -assignments[a]['prompts'], a)
+    wait = {a: len(data['deps']) for a, data in assignments.items()}
+    ready = [key(a) for a in assignments if wait[a] == 0]
+    heapq.heapify(ready)
+    days, left = 0, len(assignments)
+    while ready:
+        days, caps, skipped, unlocked, before = days + 1, [K]*N, [], [], left
+        while ready:
+            item = heapq.heappop(ready); p = assignments[item[2]]['prompts']
+            i = bisect_left(caps, p)
+            if i == N: skipped.append(item); continue
+            insort(caps, caps.pop(i) - p); left -= 1
+            for c in kids[item[2]]:
+                wait[c] -= 1
+                if wait[c] == 0: (heapq.heappush(ready, key(c)) if mode == 1 else unlocked.append(key(c)))
+        if left == before: return -1  # nothing fits anybody
+        ready = skipped + unlocked; heapq.heapify(ready)
+    return days if left == 0 else -1
 
-def find_min_days(assignments, N, K, mode):
+def find_min_days(assignments, N, K, mode, stats=None, order='cp', seed=0):
     if max(d['prompts'] for d in assignments.values()) > K: return -1
     check = can_complete_mode1 if mode == 1 else can_complete_mode2
     low, high, result = 1, len(assignments), -1
+    ub = greedy_days(assignments, N, K, mode)  # known-feasible upper bound
+    if ub != -1: high, result = ub - 1, ub
     while low <= high:
         mid = (low + high) // 2
-        if check(assignments, N, K, mid): result, high = mid, mid - 1
+        if check(assignments, N, K, mid, stats, order, seed): result, high = mid, mid - 1
         else: low = mid + 1
     return result
 
-def find_min_prompts(assignments, N, M, mode):
+def find_min_prompts(assignments, N, M, mode, stats=None, order='cp', seed=0):
     check = can_complete_mode1 if mode == 1 else can_complete_mode2
     low = max(d['prompts'] for d in assignments.values())
     high = sum(d['prompts'] for d in assignments.values())
     result = -1
     while low <= high:
         mid = (low + high) // 2
-        if check(assignments, N, mid, M): result, high = mid, mid - 1
+        if check(assignments, N, mid, M, stats, order, seed): result, high = mid, mid - 1
         else: low = mid + 1
     return result
 
@@ -109,20 +233,40 @@ def main():
     query.add_argument('--find-prompts', action='store_true')
     parser.add_argument('--K', type=int)
     parser.add_argument('--M', type=int)
+    parser.add_argument('--profile', nargs='?', const='basic', choices=PROFILE_MODES)
+    parser.add_argument('--profile-out', default='search.pstats')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the persistent result cache')
+    parser.add_argument('--order', default='cp', choices=ORDERS, help='Branch order of the probes (default cp)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for --order random')
+    parser.add_argument('--stats', action='store_true', help='Print search node counts')
     args = parser.parse_args()
+    prof = Profiler(args.profile, args.profile_out, 'search')
 
     if args.find_days and args.K is None: parser.error('--K required with --find-days')
     if args.find_prompts and args.M is None: parser.error('--M required with --find-prompts')
 
-    assignments = parse_input(args.input_file)
-    if has_cycle(assignments): print("Error: Cyclic dependencies"); sys.exit(1)
+    with prof.phase('parse'): assignments = parse_input(args.input_file)
+    with prof.phase('cycle-check'):
+        if has_cycle(assignments): print("Error: Cyclic dependencies"); sys.exit(1)
 
-    if args.find_days:
-        result = find_min_days(assignments, args.N, args.K, args.mode)
-        print(f"Minimum Days: {result}" if result != -1 else "Impossible")
-    else:
-        result = find_min_prompts(assignments, args.N, args.M, args.mode)
-        print(f"Minimum Prompts: {result}" if result != -1 else "Impossible")
+    cache = ResultCache(enabled=not args.no_cache)
+    key = cache_key(assignments, 'assg02', source_digest([__name__, 'graph', 'feasibility', 'heuristics']), args.mode, args.N,
+                    'days' if args.find_days else 'prompts', args.K if args.find_days else args.M)
+    stats = {}
+    with prof.phase('search'):
+        result = cache.get(key)
+        if result is None:
+            if args.find_days: result = find_min_days(assignments, args.N, args.K, args.mode, stats, args.order, args.seed)
+            else: result = find_min_prompts(assignments, args.N, args.M, args.mode, stats, args.order, args.seed)
+            cache.put(key, result)
+    if args.find_days: print(f"Minimum Days: {result}" if result != -1 else "Impossible")
+    else: print(f"Minimum Prompts: {result}" if result != -1 else "Impossible")
+    if args.stats:
+        if not stats: print("Search nodes: 0 (answer from cache)")
+        else: print(f"Search nodes: {stats['nodes']} ({stats.get('success_nodes', 0)} in "
+                    f"{stats.get('successes', 0)} feasible probe(s) up to the witness, "
+                    f"{stats['restarts']} restart(s))")
+    prof.report()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
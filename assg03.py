@@ -1,5 +1,14 @@
-import sys, argparse, heapq, math
+import sys, argparse, heapq, time, queue
+import multiprocessing as mp
 from itertools import combinations
+from profiling import Profiler, PROFILE_MODES
+from cache import ResultCache, cache_key, source_digest
+from heuristics import DayBound
+from graph import find_interchangeable_classes, symmetry_predecessors
+try:
+    import numpy as np
+except ImportError:  # optional: scheme screening falls back to pure Python
+    np = None
 
 def parse_input(filename):
     assignments = {}
@@ -33,6 +42,13 @@ def get_ready(completed, assignments):
 
 def llm_type(aid): return 'chatgpt' if aid % 2 == 0 else 'gemini'
 
+# Interchangeable assignments of the same LLM type are only picked in ID order:
+# twins() maps each to the class member before it; in_order() checks a combo
+def twins(asgn): return symmetry_predecessors(find_interchangeable_classes(asgn, llm_type))
+
+def in_order(combo, done, tw):
+    return all(tw[a] in done or tw[a] in combo for a in combo if a in tw)
+
 def critical_path_len(assignments, completed):
     memo = {}
     def depth(aid):
@@ -43,22 +59,30 @@ def critical_path_len(assignments, completed):
     remaining = [a for a in assignments if a not in completed]
     return max((depth(a) for a in remaining), default=0)
 
-def h_days(asgn, done, g, h):
-    rg = sum(asgn[a]['prompts'] for a in asgn if a not in done and llm_type(a)=='chatgpt')
-    rm = sum(asgn[a]['prompts'] for a in asgn if a not in done and llm_type(a)=='gemini')
-    cg = math.ceil(rg/g) if g > 0 else (float('inf') if rg > 0 else 0)
-    cm = math.ceil(rm/h) if h > 0 else (float('inf') if rm > 0 else 0)
-    return max(critical_path_len(asgn, done), cg, cm)
+IDA_TT = 4096  # default IDA* transposition table size
+
+# Nogoods shared across a whole find_days/find_cost sweep: done -> [(g, h, left)]
+# for which the state was proven unable to finish in `left` more days. Dead
+# under (g', h', left') means dead under any g <= g', h <= h', left <= left'.
+def is_nogood(ng, done, g, h, left):
+    return ng is not None and any(g <= a and h <= b and left <= c for a, b, c in ng.get(done, ()))
+
+def add_nogood(ng, done, g, h, left):
+    if ng is None: return
+    kept = [e for e in ng.get(done, ()) if not (e[0] <= g and e[1] <= h and e[2] <= left)]
+    ng[done] = kept + [(g, h, left)]
 
 # Case-A: one assignment per student per day
-def schedule_A(asgn, N, g, h, M, algo='dfs'):
+def schedule_A(asgn, N, g, h, M, algo='dfs', trace=None, tt=IDA_TT, ng=None):
     total, best, nodes = len(asgn), [float('inf')], [0]
+    hd, tw = DayBound(asgn, N, g, h, 'A'), twins(asgn)
     def dfs(day, done):
         nodes[0] += 1
         if len(done) == total:
             best[0] = min(best[0], day-1); return True
-        if day > M: return False
-        if algo=='dfbb' and day-1+h_days(asgn,done,g,h) >= best[0]: return False
+        if day > M or is_nogood(ng, done, g, h, M-day+1): return False
+        # Bound against the incumbent and the deadline
+        if algo=='dfbb' and day-1+hd(done) >= min(best[0], M+1): return False
         ready = get_ready(done, asgn)
         if not ready: return False
         found = False
@@ -66,34 +90,39 @@ def schedule_A(asgn, N, g, h, M, algo='dfs'):
             for combo in combinations(ready, sz):
                 gn = sum(asgn[a]['prompts'] for a in combo if llm_type(a)=='chatgpt')
                 mn = sum(asgn[a]['prompts'] for a in combo if llm_type(a)=='gemini')
-                if gn <= g and mn <= h:
+                if gn <= g and mn <= h and in_order(combo, done, tw):
                     if dfs(day+1, done|frozenset(combo)):
                         found = True
                         if algo != 'dfs': return True
+        # DFBB returns on its first solution, so a miss here is never bound-pruned
+        if not found: add_nogood(ng, done, g, h, M-day+1)
         return found
-    if algo == 'astar': return astar_A(asgn, N, g, h, M, nodes)
+    if algo == 'astar': return astar_A(asgn, N, g, h, M, nodes, ng, hd)
+    if algo == 'idastar': return idastar(asgn, g, h, M, nodes, succ_A(asgn, N, g, h), hd, trace, tt, ng)
     dfs(1, frozenset())
     return (best[0] if best[0] != float('inf') else -1), nodes[0]
 
-def astar_A(asgn, N, g, h, M, nodes):
-    total = len(asgn)
-    pq = [(h_days(asgn, frozenset(), g, h), 0, frozenset())]
+def astar_A(asgn, N, g, h, M, nodes, ng=None, hd=None):
+    total, hd, tw = len(asgn), hd or DayBound(asgn, N, g, h, 'A'), twins(asgn)
+    pq = [(hd(frozenset()), 0, frozenset())]
     visited = set()
     while pq:
         f, day, done = heapq.heappop(pq)
         nodes[0] += 1
         if len(done) == total: return day, nodes[0]
         if day >= M: continue
-        if done in visited: continue
+        if done in visited or is_nogood(ng, done, g, h, M-day): continue
         visited.add(done)
         ready = get_ready(done, asgn)
         for sz in range(1, min(N,len(ready))+1):
             for combo in combinations(ready, sz):
                 gn = sum(asgn[a]['prompts'] for a in combo if llm_type(a)=='chatgpt')
                 mn = sum(asgn[a]['prompts'] for a in combo if llm_type(a)=='gemini')
-                if gn <= g and mn <= h:
+                if gn <= g and mn <= h and in_order(combo, done, tw):
                     nd = done | frozenset(combo)
-                    heapq.heappush(pq, (day+1+h_days(asgn,nd,g,h), day+1, nd))
+                    f = day+1+hd(nd)
+                    if f <= M: heapq.heappush(pq, (f, day+1, nd))
+    add_nogood(ng, frozenset(), g, h, M)
     return -1, nodes[0]
 
 # Case-B helpers: next-day sharing
@@ -108,16 +137,19 @@ def ready_B(done, prev, asgn, sd):
             if ok: ready.append((aid, ok))
     return ready
 
-def schedule_B(asgn, N, g, h, M, algo='dfs'):
+def schedule_B(asgn, N, g, h, M, algo='dfs', trace=None, tt=IDA_TT, ng=None):
     total, best, nodes = len(asgn), [float('inf')], [0]
+    hd, tw = DayBound(asgn, N, g, h, 'B'), twins(asgn)
+    # Nogoods are only kept for day-start states (hw False: nothing done yet today)
     def dfs(day, done, prev, rg, rm, sd, hw):
         nodes[0] += 1
         if len(done) == total:
             best[0] = min(best[0], day); return True
-        if day > M: return False
-        if algo=='dfbb' and day-1+h_days(asgn,done,g,h) >= best[0]: return False
+        if day > M or (not hw and is_nogood(ng, done, g, h, M-day+1)): return False
+        if algo=='dfbb' and day-1+hd(done) >= min(best[0], M+1): return False
         found = False
         for aid, allowed in ready_B(done, prev, asgn, sd):
+            if aid in tw and tw[aid] not in done: continue
             p = asgn[aid]['prompts']
             gpt = llm_type(aid)=='chatgpt'
             if (rg if gpt else rm) >= p:
@@ -130,18 +162,20 @@ def schedule_B(asgn, N, g, h, M, algo='dfs'):
         if hw and dfs(day+1, done, done, g, h, {i:set() for i in range(N)}, False):
             found = True
             if algo != 'dfs': return True
+        if not found and not hw: add_nogood(ng, done, g, h, M-day+1)
         return found
-    if algo == 'astar': return astar_B(asgn, N, g, h, M, nodes)
+    if algo == 'astar': return astar_B(asgn, N, g, h, M, nodes, ng, hd)
+    if algo == 'idastar': return idastar(asgn, g, h, M, nodes, succ_B(asgn, N, g, h), hd, trace, tt, ng)
     dfs(1, frozenset(), frozenset(), g, h, {i:set() for i in range(N)}, False)
     return (best[0] if best[0] != float('inf') else -1), nodes[0]
 
-def astar_B(asgn, N, g, h, M, nodes):
-    total = len(asgn)
-    pq = [(h_days(asgn,frozenset(),g,h), 0, 1, frozenset(), frozenset())]
-    visited, ctr = set(), 0
+def expand_B(asgn, N, done, g, h, tw=None):
+    # all end-of-day completed sets reachable from `done` in one Case B day
+    tw = twins(asgn) if tw is None else tw
     def day_expand(comp, prev, rg, rm, sd):
         results = set()
         for aid, allowed in ready_B(comp, prev, asgn, sd):
+            if aid in tw and tw[aid] not in comp: continue
             p = asgn[aid]['prompts']
             gpt = llm_type(aid)=='chatgpt'
             if (rg if gpt else rm) >= p:
@@ -150,22 +184,109 @@ def astar_B(asgn, N, g, h, M, nodes):
                 results |= day_expand(comp|{aid}, prev, rg-(p if gpt else 0), rm-(p if not gpt else 0), nsd)
         results.add(comp)
         return results
+    return day_expand(done, done, g, h, {i:set() for i in range(N)})
+
+def astar_B(asgn, N, g, h, M, nodes, ng=None, hd=None):
+    total, hd, tw = len(asgn), hd or DayBound(asgn, N, g, h, 'B'), twins(asgn)
+    pq = [(hd(frozenset()), 0, 1, frozenset(), frozenset())]
+    visited, ctr = set(), 0
     while pq:
         f, _, day, done, prev = heapq.heappop(pq)
         nodes[0] += 1
         if len(done) == total: return day-1, nodes[0]
         if day > M: continue
         key = (day, done)
-        if key in visited: continue
+        if key in visited or is_nogood(ng, done, g, h, M-day+1): continue
         visited.add(key)
-        for nd in day_expand(done, prev, g, h, {i:set() for i in range(N)}):
-            if nd != done:
+        for nd in expand_B(asgn, N, done, g, h, tw):
+            if nd != done and day+hd(nd) <= M:
                 ctr += 1
-                heapq.heappush(pq, (day+h_days(asgn,nd,g,h), ctr, day+1, nd, nd))
+                heapq.heappush(pq, (day+hd(nd), ctr, day+1, nd, nd))
+    add_nogood(ng, frozenset(), g, h, M)
     return -1, nodes[0]
 
+# IDA*: iterative deepening on f = days used + hd (heuristics.DayBound), memory
+# linear in M.
+# tt bounds the transposition table (done -> fewest days seen this iteration);
+# trace collects {threshold: [iterations, nodes]} across calls.
+def idastar(asgn, g, h, M, nodes, succ, hd, trace=None, tt=IDA_TT, ng=None):
+    total, inf = len(asgn), float('inf')
+    def search(day, done, bound, seen):
+        nodes[0] += 1
+        f = day + hd(done)
+        if f > bound: return None, f
+        if len(done) == total: return day, f
+        if day >= M or seen.get(done, inf) <= day or is_nogood(ng, done, g, h, M-day):
+            return None, inf
+        if len(seen) < tt: seen[done] = day
+        nxt = inf
+        for nd in succ(done):
+            d, t = search(day+1, nd, bound, seen)
+            if d is not None: return d, t
+            nxt = min(nxt, t)
+        return None, nxt
+    bound = hd(frozenset())
+    while bound <= M:
+        before = nodes[0]
+        d, nxt = search(0, frozenset(), bound, {})
+        if trace is not None:
+            it = trace.setdefault(bound, [0, 0]); it[0] += 1; it[1] += nodes[0]-before
+        if d is not None: return d, nodes[0]
+        bound = nxt
+    add_nogood(ng, frozenset(), g, h, M)
+    return -1, nodes[0]
+
+def succ_A(asgn, N, g, h):
+    tw = twins(asgn)
+    def succ(done):
+        ready = get_ready(done, asgn)
+        for sz in range(min(N,len(ready)), 0, -1):
+            for combo in combinations(ready, sz):
+                gn = sum(asgn[a]['prompts'] for a in combo if llm_type(a)=='chatgpt')
+                mn = sum(asgn[a]['prompts'] for a in combo if llm_type(a)=='gemini')
+                if gn <= g and mn <= h and in_order(combo, done, tw): yield done | frozenset(combo)
+    return succ
+
+def succ_B(asgn, N, g, h):
+    tw = twins(asgn)
+    return lambda done: (nd for nd in expand_B(asgn, N, done, g, h, tw) if nd != done)
+
+# Scheme screening: a cheap lower bound on days for every (g, h) at once.
+# Per-type prompt totals bound both cases; the critical path only Case A.
+def scheme_bounds(asgn, case, gs, hs):
+    tg = sum(asgn[a]['prompts'] for a in asgn if llm_type(a)=='chatgpt')
+    tm = sum(asgn[a]['prompts'] for a in asgn if llm_type(a)=='gemini')
+    base = critical_path_len(asgn, frozenset()) if case=='A' else 0
+    if np is None:
+        cd = lambda t, c: -(-t//c) if c > 0 else (float('inf') if t > 0 else 0)
+        return [max(base, cd(tg,g), cd(tm,h)) for g, h in zip(gs, hs)]
+    def cd(t, c):
+        c = np.asarray(c, dtype=np.int64)
+        return np.where(c > 0, -(-t // np.maximum(c, 1)), np.inf if t > 0 else 0)
+    return np.maximum(np.maximum(cd(tg, gs), cd(tm, hs)), base).tolist()
+
+# State shared between racing engines: (best, work, engine). best is an mp.Array
+# [value, tie-break, tie-break, owner], value -1 = none yet; keys compare as
+# tuples, smaller is better, and owner is the index of the engine whose own
+# search found it. work[i] counts the nodes engine i has searched so far.
+def incumbent(shared):
+    if shared is None: return None
+    best = shared[0]
+    with best.get_lock(): return None if best[0] == -1 else tuple(best[:3])
+
+def offer(shared, key):
+    if shared is None: return
+    best, _, engine = shared
+    with best.get_lock():
+        if best[0] == -1 or list(key) < best[:3]: best[:] = list(key) + [engine]
+
+def spend(shared, n):
+    if shared is None: return
+    work, engine = shared[1], shared[2]
+    with work.get_lock(): work[engine] += n
+
 # Query drivers
-def find_days(asgn, N, case, budget, c1, c2, M_up, algo):
+def find_days(asgn, N, case, budget, c1, c2, M_up, algo, trace=None, tt=IDA_TT, shared=None):
     schemes = []
     for gg in range(0, int(budget//c1)+1):
         hh = int((budget-gg*c1)//c2) if c2>0 else 0
@@ -173,30 +294,133 @@ def find_days(asgn, N, case, budget, c1, c2, M_up, algo):
     mg = max((asgn[a]['prompts'] for a in asgn if llm_type(a)=='chatgpt'), default=0)
     mm = max((asgn[a]['prompts'] for a in asgn if llm_type(a)=='gemini'), default=0)
     schemes = [(g,h) for g,h in schemes if g>=mg and h>=mm]
-    sched = schedule_A if case=='A' else schedule_B
-    best, nc, bs = float('inf'), 0, None
-    for gg, hh in schemes:
-        d, n = sched(asgn, N, gg, hh, min(M_up,best-1) if best!=float('inf') else M_up, algo)
-        nc += n
-        if d != -1 and d < best: best, bs = d, (gg,hh)
+    lb = scheme_bounds(asgn, case, [g for g,_ in schemes], [h for _,h in schemes])
+    sched, ng = (schedule_A if case=='A' else schedule_B), {}
+    # Search in bound order; ties go to the earlier scheme, as in budget order
+    best, bi, nc, bs = float('inf'), len(schemes), 0, None
+    for i in sorted(range(len(schemes)), key=lambda i: (lb[i], i)):
+        inc = incumbent(shared)   # (days, scheme index, 0) from a racing engine
+        if inc and inc[:2] < (best, bi): best, bi, bs = inc[0], inc[1], schemes[inc[1]]
+        if lb[i] > min(M_up, best): break
+        if lb[i] == best and i > bi: continue
+        gg, hh = schemes[i]
+        cap = best if i < bi else best-1
+        d, n = sched(asgn, N, gg, hh, min(M_up,cap) if best!=float('inf') else M_up, algo, trace, tt, ng)
+        nc += n; spend(shared, n)
+        if d != -1 and (d < best or i < bi):
+            best, bi, bs = d, i, (gg,hh)
+            offer(shared, (d, i, 0))
     return (best if best!=float('inf') else -1), nc, bs
 
-def find_cost(asgn, N, case, M, c1, c2, algo):
+def find_cost(asgn, N, case, M, c1, c2, algo, trace=None, tt=IDA_TT, shared=None):
     mg = max((asgn[a]['prompts'] for a in asgn if llm_type(a)=='chatgpt'), default=0)
     mm = max((asgn[a]['prompts'] for a in asgn if llm_type(a)=='gemini'), default=0)
     tg = sum(asgn[a]['prompts'] for a in asgn if llm_type(a)=='chatgpt')
     tm = sum(asgn[a]['prompts'] for a in asgn if llm_type(a)=='gemini')
-    sched = schedule_A if case=='A' else schedule_B
-    best, nc, bs = float('inf'), 0, None
-    for gg in range(mg, tg+1):
-        for hh in range(mm, tm+1):
-            cost = gg*c1 + hh*c2
-            if cost >= best: continue
-            d, n = sched(asgn, N, gg, hh, M, algo)
-            nc += n
-            if d != -1 and cost < best: best, bs = cost, (gg,hh)
+    sched, ng = (schedule_A if case=='A' else schedule_B), {}
+    # Screen rows and columns: the bound is max(base, f(g), f(h)), so a g row
+    # survives if (g, tm) does and every row starts at the first surviving h
+    gs, hs = range(mg, tg+1), range(mm, tm+1)
+    rows = scheme_bounds(asgn, case, list(gs), [tm]*len(gs))
+    cols = scheme_bounds(asgn, case, [tg]*len(hs), list(hs))
+    lo = next((h for h, b in zip(hs, cols) if b <= M), None)
+    if lo is None: return -1, 0, None
+    # Feasibility is monotone in g and h, so walk the Pareto staircase: per g,
+    # find the smallest feasible h below the previous g's answer. The screened
+    # bound is usually tight, so gallop up from it before bisecting.
+    best, nc, bs, hi, known = float('inf'), 0, None, tm, False
+    def fits(gg, hh):
+        nonlocal nc
+        d, n = sched(asgn, N, gg, hh, M, algo, trace, tt, ng)
+        nc += n; spend(shared, n)
+        return d != -1
+    for gg, b in zip(gs, rows):
+        inc = incumbent(shared)   # (cost, g, h) from a racing engine
+        if inc and inc[:2] < (best, bs[0] if bs else 0): best, bs = inc[0], inc[1:]
+        if b > M: continue
+        top = hi
+        if best != float('inf'):
+            # Strictly cheaper than the incumbent; equal cost only wins at a lower g
+            room = best - gg*c1 - (1 if gg >= bs[0] else 0)
+            if room < 0: break
+            if c2 > 0: top = min(top, room//c2)
+        l, r, found, step = lo, top, None, 1
+        if known and top == hi: found, r = hi, hi-1
+        while l <= r:                 # gallop: l, l+1, l+3, l+7, ...
+            probe = min(l + step - 1, r)
+            if fits(gg, probe): found, r = probe, probe-1; break
+            l, step = probe+1, step*2
+        while l <= r:                 # then bisect what is left below it
+            mid = (l+r)//2
+            if fits(gg, mid): found, r = mid, mid-1
+            else: l = mid+1
+        if found is None: continue
+        hi, known = found, True
+        cost = gg*c1 + found*c2
+        if cost < best or (cost == best and gg < bs[0]):
+            best, bs = cost, (gg,found)
+            offer(shared, (cost, gg, found))
     return (best if best!=float('inf') else -1), nc, bs
 
+# Portfolio racing: every engine answers the same query in its own process,
+# sharing the incumbent. Each engine is exact, so the first to finish has
+# proven the optimum and the rest are cancelled. DFBB is not raced: it stops
+# at the first schedule within the bound, which need not be optimal (and as a
+# shared incumbent would mislead the others). An engine may finish on an
+# incumbent another engine found, so the winner reported is the engine whose
+# own search found the optimum (the finisher if there is none), with its nodes.
+RACE_ALGOS = ['dfs', 'astar', 'idastar']
+RACE_POLL = 0.5  # seconds between liveness checks of the engines
+
+def _race_worker(algo, query, args, tt, shared, out):
+    start = time.perf_counter()
+    fn = find_days if query == 'days' else find_cost
+    try:
+        r, nc, s = fn(*args, algo, None, tt, shared)
+        out.put((algo, r, nc, s, time.perf_counter() - start, None))
+    except Exception as e:
+        out.put((algo, None, 0, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"))
+
+def race(asgn, N, case, query, value, c1, c2, tt=IDA_TT, algos=RACE_ALGOS):
+    # returns (winner, result, nodes, scheme, {algo: (seconds, finished?)});
+    # raises RuntimeError if every engine exits without an answer
+    best, work, out = mp.Array('q', [-1, -1, -1, -1]), mp.Array('q', len(algos)), mp.Queue()
+    args = (asgn, N, case, value, c1, c2) + ((len(asgn),) if query == 'days' else ())
+    procs = {a: mp.Process(target=_race_worker, args=(a, query, args, tt, (best, work, i), out), daemon=True)
+             for i, a in enumerate(algos)}
+    start = time.perf_counter()
+    for p in procs.values(): p.start()
+    errors, result = {}, None
+    while result is None:
+        try: msg = out.get(timeout=RACE_POLL)
+        except queue.Empty:
+            if all(p.exitcode is not None for p in procs.values()):
+                try: msg = out.get(timeout=RACE_POLL)   # flushed as the last one exited
+                except queue.Empty: break
+            else: continue
+        if msg[5] is None: result = msg
+        else: errors[msg[0]] = msg[5]
+        if len(errors) == len(algos): break
+    cancelled = time.perf_counter() - start
+    for p in procs.values(): p.terminate()
+    for p in procs.values(): p.join()
+    if result is None:
+        for a, p in procs.items():
+            errors.setdefault(a, f"exited with code {p.exitcode} without a result")
+        raise RuntimeError("every engine failed: " + "; ".join(f"{a}: {e}" for a, e in errors.items()))
+    finisher, r, nc, s, took, _ = result
+    times = {a: (cancelled, False) for a in algos}
+    times[finisher] = (took, True)
+    while True:   # engines that also finished before being cancelled
+        try: a, _, _, _, t, err = out.get_nowait()
+        except queue.Empty: break
+        if err is None: times[a] = (t, True)
+    # A terminated engine may have died holding an array lock, so the shared
+    # state is read through the raw arrays from here on, never the lock
+    best, work = best.get_obj(), work.get_obj()
+    winner = algos[best[3]] if r != -1 and best[0] == r and best[3] != -1 else finisher
+    return winner, r, work[algos.index(winner)], (tuple(s) if s else s), times
+
 def main():
     p = argparse.ArgumentParser(description='Assignment 3: Dual-LLM scheduling')
     p.add_argument('input_file'); p.add_argument('--case', required=True, choices=['A','B'])
@@ -205,24 +429,62 @@ def main():
     q = p.add_mutually_exclusive_group(required=True)
     q.add_argument('--find-days', action='store_true'); q.add_argument('--find-cost', action='store_true')
     p.add_argument('--budget', type=int); p.add_argument('--M', type=int)
-    p.add_argument('--algo', default='all', choices=['dfs','dfbb','astar','all'])
+    p.add_argument('--algo', default='all', choices=['dfs','dfbb','astar','idastar','all'])
+    p.add_argument('--tt', type=int, default=IDA_TT, help='IDA* transposition table size (0 disables)')
+    p.add_argument('--race', action='store_true', help='Race all engines in parallel, report the one that found the optimum')
+    p.add_argument('--profile', nargs='?', const='basic', choices=PROFILE_MODES)
+    p.add_argument('--profile-out', default='search.pstats', help='pstats file (one per algo: <algo>.<file>)')
+    p.add_argument('--no-cache', action='store_true', help='Bypass the persistent result cache')
     args = p.parse_args()
     if args.find_days and args.budget is None: p.error('--budget required with --find-days')
     if args.find_cost and args.M is None: p.error('--M required with --find-cost')
-    asgn = parse_input(args.input_file)
-    if has_cycle(asgn): print("Error: Cyclic dependencies"); sys.exit(1)
+    if args.race and args.algo != 'all': p.error('--race runs every algorithm; drop --algo')
+    prof = Profiler(args.profile)
+    with prof.phase('parse'): asgn = parse_input(args.input_file)
+    with prof.phase('cycle-check'):
+        if has_cycle(asgn): print("Error: Cyclic dependencies"); sys.exit(1)
     algos = ['dfs','dfbb','astar'] if args.algo=='all' else [args.algo]
     print(f"Case {args.case} | N={args.N} | c1={args.c1} c2={args.c2}")
     print("-"*50)
+    if args.race:
+        # Not cached: which engine wins, and its node count, vary run to run
+        query, value = ('days', args.budget) if args.find_days else ('cost', args.M)
+        with prof.phase('race'):
+            try: w, r, nc, s, times = race(asgn, args.N, args.case, query, value, args.c1, args.c2, args.tt)
+            except RuntimeError as e: print(f"Error: {e}"); sys.exit(1)
+        lbl = f"[{w.upper():>5}]"
+        if r == -1: print(f"{lbl} Impossible | Nodes: {nc}")
+        elif args.find_days: print(f"{lbl} Min Days: {r} | Scheme: g={s[0]},h={s[1]} | Nodes: {nc}")
+        else: print(f"{lbl} Min Cost: {r} | Scheme: g={s[0]},h={s[1]} | Nodes: {nc}")
+        for algo in RACE_ALGOS:
+            t, done = times[algo]
+            status = 'won' if algo == w else ('finished' if done else 'cancelled')
+            print(f"        {algo:<8}{status:<10}{t:.4f}s")
+        prof.report()
+        return
+    cache, src = ResultCache(enabled=not args.no_cache), source_digest([__name__, 'heuristics', 'graph'])
     for algo in algos:
-        if args.find_days:
-            r, nc, s = find_days(asgn, args.N, args.case, args.budget, args.c1, args.c2, len(asgn), algo)
-        else:
-            r, nc, s = find_cost(asgn, args.N, args.case, args.M, args.c1, args.c2, algo)
+        trace = {} if algo == 'idastar' else None
+        prof.cprofile_phase, prof.pstats_path = algo, f"{algo}.{args.profile_out}"
+        key = cache_key(asgn, 'assg03', src, args.case, args.N, args.c1, args.c2, algo, args.tt,
+                        'days' if args.find_days else 'cost', args.budget if args.find_days else args.M)
+        with prof.phase(algo):
+            hit = cache.get(key)
+            if hit is not None:
+                r, nc, s, tr = hit
+                if trace is not None: trace.update({int(b): v for b, v in tr.items()})
+            elif args.find_days:
+                r, nc, s = find_days(asgn, args.N, args.case, args.budget, args.c1, args.c2, len(asgn), algo, trace, args.tt)
+            else:
+                r, nc, s = find_cost(asgn, args.N, args.case, args.M, args.c1, args.c2, algo, trace, args.tt)
+            if hit is None: cache.put(key, [r, nc, s, trace or {}])
         lbl = f"[{algo.upper():>5}]"
         if r == -1: print(f"{lbl} Impossible | Nodes: {nc}")
         elif args.find_days: print(f"{lbl} Min Days: {r} | Scheme: g={s[0]},h={s[1]} | Nodes: {nc}")
         else: print(f"{lbl} Min Cost: {r} | Scheme: g={s[0]},h={s[1]} | Nodes: {nc}")
+        for bound, (its, n) in sorted((trace or {}).items()):
+            print(f"        f<={bound}: {its} iteration(s), {n} nodes")
+    prof.report()
 
 if __name__ == "__main__":
     main()
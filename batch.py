@@ -0,0 +1,275 @@
+"""
+batch.py - Batch Runs Over Many Inputs on a Process Pool
+
+Runs a whole grid of queries (every file matching a glob, every combination
+of parameter values) in one process tree instead of one interpreter per
+invocation. Each job is a daemon.py request, answered by daemon.execute(),
+so main.py enumeration / counting, assg02.py and assg03.py are all covered
+and every worker keeps its parsed problems warm between jobs.
+
+Manifest (JSON; globs are relative to the manifest's directory):
+
+    {
+      "workers": 8,                      (optional, default: CPUs)
+      "timeout": 300,                    (optional, seconds per job)
+      "jobs": [
+        {"op": "count", "files": "inputs/*.txt", "grid": {"M": [3, 4, 5]}},
+        {"op": "min-days", "files": ["input01.txt"], "grid": {"mode": [1, 2]}},
+        {"op": "min-cost", "files": "inputs/*.txt",
+         "params": {"c1": 1, "c2": 2}, "grid": {"M": [4, 5], "case": ["A", "B"]}}
+      ]
+    }
+
+"params" are passed to every job of an entry, "grid" values are combined
+in every way. Parameter names are those of daemon.py.
+
+Scheduling:
+- Jobs are started largest first (assignments, then total prompts, then
+  M), so the long ones do not end up running alone at the end
+- Workers are long-lived processes; a job past its timeout has its worker
+  killed and replaced, and is reported as timed out
+- Results are appended to one JSONL file as jobs finish, one line per job:
+  {"job", "op", "file", <params>, "ok", "result" | "error", "seconds"}
+
+Usage:
+    python batch.py <manifest.json> [--out results.jsonl] [--workers N] [--timeout S]
+
+Author: AAI Assignment 1
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional, TextIO
+
+from daemon import execute, OPERATIONS
+from parser import parse_input
+
+BATCH_OPERATIONS = tuple(op for op in OPERATIONS if op != 'stats')
+
+
+# =============================================================================
+# Manifest
+# =============================================================================
+
+def load_manifest(path: str) -> dict:
+    """
+    Read a manifest and expand it into jobs.
+
+    Returns:
+        {'workers', 'timeout', 'jobs': [request dicts]}; every request has
+        'op', an absolute 'file' and its parameters
+
+    Raises:
+        ValueError: If the manifest is malformed, an op is unknown or a
+                    glob matches nothing
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Corrupt manifest: {e}")
+    if not isinstance(data, dict) or not isinstance(data.get('jobs'), list):
+        raise ValueError("Manifest must be an object with a 'jobs' list")
+
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for number, entry in enumerate(data['jobs'], 1):
+        op = entry.get('op')
+        if op not in BATCH_OPERATIONS:
+            raise ValueError(f"Job entry {number}: unknown op '{op}', "
+                             f"expected one of {BATCH_OPERATIONS}")
+        patterns = entry.get('files', [])
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        files = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(os.path.join(base, pattern)))
+            if not matches:
+                raise ValueError(f"Job entry {number}: '{pattern}' matches no file")
+            files.extend(matches)
+        grid = entry.get('grid', {})
+        names = sorted(grid)
+        for path_ in files:
+            for values in itertools.product(*(grid[name] for name in names)):
+                jobs.append(dict(entry.get('params', {}), **dict(zip(names, values)),
+                                 op=op, file=path_))
+    return {'workers': data.get('workers'), 'timeout': data.get('timeout'), 'jobs': jobs}
+
+
+def largest_first(jobs: List[dict]) -> List[dict]:
+    """Jobs ordered by problem size (assignments, prompts, then M), largest first."""
+    sizes: Dict[str, tuple] = {}
+    for job in jobs:
+        if job['file'] not in sizes:
+            try:
+                _, _, assignments = parse_input(job['file'])
+                sizes[job['file']] = (len(assignments),
+                                      sum(a.prompt_count for a in assignments.values()))
+            except (OSError, ValueError):
+                sizes[job['file']] = (0, 0)  # Its worker reports the error
+    return sorted(jobs, key=lambda job: sizes[job['file']] + (job.get('M', 0),),
+                  reverse=True)
+
+
+# =============================================================================
+# Workers
+# =============================================================================
+
+def _worker_loop(conn) -> None:
+    """Answer jobs from `conn` until it sends None (runs in a worker process)."""
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        start = time.perf_counter()
+        try:
+            reply = {'ok': True, 'result': execute(request)}
+        except KeyError as e:
+            reply = {'ok': False, 'error': f"Missing parameter {e}"}
+        except Exception as e:  # Report every failure in the results file
+            reply = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        reply['seconds'] = round(time.perf_counter() - start, 6)
+        conn.send(reply)
+
+
+class Worker:
+    """One long-lived worker process and the job it is running."""
+
+    def __init__(self):
+        self.conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_loop, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.job: Optional[tuple] = None  # (number, request, deadline)
+
+    def start(self, number: int, request: dict, timeout: Optional[float]) -> None:
+        deadline = time.monotonic() + timeout if timeout else None
+        self.job = (number, request, deadline)
+        self.conn.send(request)
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            self.conn.send(None)
+        self.process.join()
+        self.conn.close()
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+def run_batch(
+    jobs: List[dict],
+    out: TextIO,
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None
+) -> dict:
+    """
+    Run every job on a pool of workers, largest first.
+
+    Args:
+        jobs: Requests from load_manifest()
+        out: Text stream receiving one JSON line per finished job
+        workers: Worker processes (default: CPUs, at most one per job)
+        timeout: Seconds a single job may run (None = no limit)
+
+    Returns:
+        {'jobs', 'ok', 'failed', 'timed_out', 'seconds'}
+    """
+    start = time.monotonic()
+    pending = list(reversed(largest_first(jobs)))  # pop() takes the largest
+    pool = [Worker() for _ in range(max(1, min(workers or os.cpu_count() or 1, len(jobs))))]
+    summary = {'jobs': len(jobs), 'ok': 0, 'failed': 0, 'timed_out': 0}
+    number = 0
+
+    def record(request: dict, job_number: int, reply: dict) -> None:
+        line = dict(request, job=job_number, file=os.path.relpath(request['file']))
+        line.update(reply)
+        out.write(json.dumps(line) + '\n')
+        out.flush()  # Finished jobs survive an interrupted batch
+        summary['ok' if reply['ok'] else 'failed'] += 1
+
+    try:
+        while True:
+            for worker in pool:
+                if worker.job is None and pending:
+                    number += 1
+                    worker.start(number, pending.pop(), timeout)
+            busy = [worker for worker in pool if worker.job is not None]
+            if not busy:
+                break
+
+            deadlines = [worker.job[2] for worker in busy if worker.job[2] is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = wait([worker.conn for worker in busy], wait_for)
+
+            for i, worker in enumerate(pool):
+                if worker.job is None:
+                    continue
+                job_number, request, deadline = worker.job
+                if worker.conn in ready:
+                    try:
+                        reply = worker.conn.recv()
+                    except EOFError:  # Worker died (e.g. out of memory)
+                        reply = {'ok': False, 'error': 'worker process died'}
+                        worker.stop(kill=True)
+                        pool[i] = Worker()
+                    worker.job = None
+                    record(request, job_number, reply)
+                elif deadline is not None and time.monotonic() >= deadline:
+                    worker.stop(kill=True)
+                    pool[i] = Worker()
+                    summary['timed_out'] += 1
+                    record(request, job_number, {'ok': False, 'error': f"timed out after {timeout:g}s",
+                                                 'seconds': timeout})
+    finally:
+        for worker in pool:
+            worker.stop(kill=worker.job is not None)
+
+    summary['seconds'] = time.monotonic() - start
+    return summary
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Run a manifest of scheduler queries')
+    arg_parser.add_argument('manifest', help='JSON manifest (file globs and parameter grids)')
+    arg_parser.add_argument('--out', default='results.jsonl',
+                            help='Consolidated JSONL results (default results.jsonl)')
+    arg_parser.add_argument('--workers', type=int, help='Worker processes (default: manifest, else CPUs)')
+    arg_parser.add_argument('--timeout', type=float, help='Seconds per job (default: manifest, else none)')
+    args = arg_parser.parse_args()
+
+    try:
+        manifest = load_manifest(args.manifest)
+    except FileNotFoundError:
+        print(f"Error: Manifest '{args.manifest}' not found.")
+        return 1
+    except ValueError as e:
+        print(f"Error in manifest: {e}")
+        return 1
+    if not manifest['jobs']:
+        print("Manifest has no jobs.")
+        return 0
+
+    workers = args.workers or manifest['workers']
+    timeout = args.timeout or manifest['timeout']
+    print(f"Running {len(manifest['jobs'])} job(s) on "
+          f"{workers or os.cpu_count()} worker(s), timeout {f'{timeout:g}s' if timeout else 'none'}")
+    with open(args.out, 'w', encoding='utf-8') as out:
+        summary = run_batch(manifest['jobs'], out, workers, timeout)
+    print(f"Done in {summary['seconds']:.2f}s: {summary['ok']} ok, {summary['failed']} failed "
+          f"({summary['timed_out']} timed out); results in {args.out}")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
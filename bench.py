@@ -0,0 +1,335 @@
+"""
+bench.py - Benchmark Runner with Stored Baselines
+
+Times the search engines on a fixed workload and compares every run with a
+baseline stored in bench_baseline.json (checked into the repository):
+- solver.solve (Assignment 1 enumeration, and one --packed-only run)
+- assg02.find_min_days / find_min_prompts (both sharing modes)
+- assg03.find_days / find_cost (every algorithm, Case A and Case B)
+
+The workload is the shipped input files plus larger instances made by a
+seeded generator, so every machine benchmarks exactly the same problems.
+The generated set grows in size and varies in shape: a mixed 13-assignment
+DAG, wide ones (few dependencies spread over the whole instance), a deep one
+(chains of single dependencies) and a heavy one (prompt counts up to K).
+Enumeration blows up on the larger ones, so each is only run on the engines
+that prune well enough to finish in well under a second.
+
+For each case we record:
+- wall:          best wall time (s) over --repeat runs
+- nodes:         search nodes expanded (deterministic)
+- nodes_per_sec: nodes / wall
+- peak_bytes:    tracemalloc peak during one extra, untimed run
+- result:        the answer itself, so a "speedup" that changes answers fails
+
+A case REGRESSES when its wall time or peak memory grows by more than
+--threshold (default 25%), or its result changes. Nodes/sec is only compared
+when the node count is unchanged: a pruning change that expands fewer nodes
+is judged on wall time alone.
+Timings below --min-time and memory growth below --min-mem are too small
+to judge reliably and are ignored. The exit code is 1 if any case regressed.
+
+Usage:
+    python bench.py                    # compare against the baseline
+    python bench.py --update           # run and rewrite the baseline
+    python bench.py --filter assg03 --threshold 0.5 --repeat 5
+
+Author: AAI Assignment 1
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import assg02
+import assg03
+import solver
+from models import Assignment
+from parser import parse_input
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCH_DIR, 'bench_baseline.json')
+BASELINE_VERSION = 1
+
+SHIPPED_INPUTS = ['ProvidedInput.txt', 'input01.txt', 'input02.txt', 'input03.txt']
+
+# (name, seed, assignments, max prompts, max deps, dependency window)
+GENERATED_INPUTS = [
+    ('gen-13', 13, 13, 4, 2, 2),
+    ('wide-14', 14, 14, 3, 1, 14),
+    ('heavy-14', 14, 14, 6, 2, 3),
+    ('deep-18', 18, 18, 3, 1, 1),
+    ('wide-20', 20, 20, 3, 1, 20),
+]
+
+ASSG03_ALGOS = ['dfs', 'dfbb', 'astar', 'idastar']
+PRUNING_ALGOS = ['dfbb', 'astar', 'idastar']
+
+
+# =============================================================================
+# Workload
+# =============================================================================
+
+def generate_instance(
+    seed: int,
+    count: int,
+    max_prompts: int,
+    max_deps: int,
+    window: int
+) -> List[Tuple[int, int, List[int]]]:
+    """
+    Build a reproducible random DAG instance.
+
+    Each assignment depends on up to max_deps of the `window` assignments
+    just before it, so the graph is acyclic by construction.
+
+    Returns:
+        List of (id, prompt_count, dependencies)
+    """
+    rng = random.Random(seed)
+    rows = []
+    for aid in range(1, count + 1):
+        pool = list(range(max(1, aid - window), aid))
+        deps = rng.sample(pool, min(len(pool), rng.randint(0, max_deps)))
+        rows.append((aid, rng.randint(1, max_prompts), sorted(deps)))
+    return rows
+
+
+def load_workload() -> Dict[str, Tuple[Dict[int, Assignment], dict]]:
+    """
+    Load every benchmark problem in both representations.
+
+    Returns:
+        name → (Assignment dict for solver.py, {'prompts', 'deps'} dict for
+        assg02/assg03)
+    """
+    problems = {}
+    for filename in SHIPPED_INPUTS:
+        _, _, assignments = parse_input(os.path.join(BENCH_DIR, filename))
+        problems[filename] = (assignments, _as_dicts(assignments))
+    for name, seed, count, max_prompts, max_deps, window in GENERATED_INPUTS:
+        rows = generate_instance(seed, count, max_prompts, max_deps, window)
+        assignments = {
+            aid: Assignment(id=aid, prompt_count=prompts, dependencies=frozenset(deps))
+            for aid, prompts, deps in rows
+        }
+        problems[name] = (assignments, _as_dicts(assignments))
+    return problems
+
+
+def _as_dicts(assignments: Dict[int, Assignment]) -> dict:
+    """Assignment objects → the plain dicts used by assg02.py / assg03.py."""
+    return {aid: {'prompts': a.prompt_count, 'deps': a.dependencies}
+            for aid, a in assignments.items()}
+
+
+def build_cases(problems) -> List[Tuple[str, Callable[[], Tuple[object, int]]]]:
+    """
+    List every benchmark case as (name, run) where run() -> (result, nodes).
+
+    Parameters are chosen so the whole suite finishes in well under a minute.
+    """
+    cases = []
+
+    def add(name, run):
+        cases.append((name, run))
+
+    # -- Assignment 1: full enumeration -------------------------------------
+    for problem, N, K, M in [('ProvidedInput.txt', 3, 5, 4), ('input01.txt', 2, 6, 5),
+                             ('input03.txt', 3, 6, 4), ('gen-13', 2, 6, 4)]:
+        assignments = problems[problem][0]
+
+        def run(assignments=assignments, N=N, K=K, M=M):
+            stats = {}
+            solutions = solver.solve(assignments, N, K, M, stats=stats)
+            packed = sum(1 for _, is_packed in solutions if is_packed)
+            return [len(solutions), packed], stats['nodes']
+        add(f"solve/{problem}/N{N}K{K}M{M}", run)
+
+    for problem, M in [('gen-13', 5), ('heavy-14', 6)]:
+        def packed_run(assignments=problems[problem][0], M=M):
+            stats = {}
+            solutions = solver.solve(assignments, 2, 6, M, stats=stats, packed_only=True)
+            return [len(solutions)], stats['nodes']
+        add(f"solve/{problem}/N2K6M{M}/packed-only", packed_run)
+
+    # -- Assignment 2: binary-searched feasibility probes ---------------------
+    # Mode 2 probes take seconds to minutes on the other inputs, so they are
+    # left out; on the larger instances only the fast queries are kept
+    both = ('days', 'prompts')
+    for problem, modes, queries in [('ProvidedInput.txt', (1, 2), both), ('input01.txt', (1,), both),
+                                    ('input02.txt', (1,), both), ('input03.txt', (1,), both),
+                                    ('gen-13', (1,), both), ('wide-14', (1,), ('prompts',)),
+                                    ('heavy-14', (1,), both), ('wide-20', (1,), ('prompts',))]:
+        asgn = problems[problem][1]
+        for mode in modes:
+            def days(asgn=asgn, mode=mode):
+                stats = {}
+                return assg02.find_min_days(asgn, 3, 6, mode, stats), stats.get('nodes', 0)
+
+            def prompts(asgn=asgn, mode=mode):
+                stats = {}
+                return assg02.find_min_prompts(asgn, 3, 4, mode, stats), stats.get('nodes', 0)
+            for query, run in (('days', days), ('prompts', prompts)):
+                if query in queries:
+                    add(f"assg02/{problem}/mode{mode}/{query}", run)
+
+    # -- Assignment 3: every algorithm, both cases ---------------------------
+    # (problem, budget for --find-days, M for --find-cost, algorithms for
+    # Case A days, Case B days and Case A cost). Plain DFS and the slower
+    # best-first runs are left out where they take seconds or more.
+    for problem, budget, M, days_a, days_b, cost_a in [
+            ('ProvidedInput.txt', 50, 6, ASSG03_ALGOS, ASSG03_ALGOS, ASSG03_ALGOS),
+            ('input01.txt', 50, 6, ASSG03_ALGOS, ASSG03_ALGOS, ASSG03_ALGOS),
+            ('input03.txt', 50, 6, ASSG03_ALGOS, ASSG03_ALGOS, ASSG03_ALGOS),
+            ('gen-13', 40, 10, ASSG03_ALGOS, PRUNING_ALGOS, ASSG03_ALGOS),
+            ('wide-14', 60, 10, PRUNING_ALGOS, ['dfbb'], PRUNING_ALGOS),
+            ('heavy-14', 60, 10, PRUNING_ALGOS, PRUNING_ALGOS, ASSG03_ALGOS),
+            ('deep-18', 60, 10, PRUNING_ALGOS, ['dfbb'], PRUNING_ALGOS),
+            ('wide-20', 60, 10, ['dfbb', 'idastar'], ['dfbb'], PRUNING_ALGOS)]:
+        asgn = problems[problem][1]
+        for case, algos in (('A', days_a), ('B', days_b)):
+            for algo in algos:
+                def find_days(asgn=asgn, case=case, algo=algo, budget=budget):
+                    r, nodes, scheme = assg03.find_days(asgn, 3, case, budget, 5, 3, len(asgn), algo)
+                    return [r, scheme], nodes
+                add(f"assg03/{problem}/{case}/days/{algo}", find_days)
+        for algo in cost_a:
+            def find_cost(asgn=asgn, algo=algo, M=M):
+                r, nodes, scheme = assg03.find_cost(asgn, 3, 'A', M, 5, 3, algo)
+                return [r, scheme], nodes
+            add(f"assg03/{problem}/A/cost/{algo}", find_cost)
+
+    return cases
+
+
+# =============================================================================
+# Measurement and comparison
+# =============================================================================
+
+def measure(run: Callable[[], Tuple[object, int]], repeat: int) -> dict:
+    """Best-of-`repeat` wall time, then one traced run for peak memory."""
+    best = float('inf')
+    for _ in range(repeat):
+        # Like timeit: no collector pauses inside the timed region
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result, nodes = run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'wall': round(best, 6),
+        'nodes': nodes,
+        'nodes_per_sec': round(nodes / best, 1) if best > 0 else 0.0,
+        'peak_bytes': peak,
+        'result': json.loads(json.dumps(result)),  # tuples → lists, as stored
+    }
+
+
+def compare(
+    current: dict,
+    base: dict,
+    threshold: float,
+    min_time: float,
+    min_mem: int
+) -> List[str]:
+    """Return the list of regressions of one case (empty = OK)."""
+    problems = []
+    if current['result'] != base['result']:
+        problems.append(f"result changed {base['result']} -> {current['result']}")
+    if current['peak_bytes'] > max(base['peak_bytes'] * (1 + threshold),
+                                   base['peak_bytes'] + min_mem):
+        problems.append(f"peak memory {base['peak_bytes']} -> {current['peak_bytes']} B")
+    if max(current['wall'], base['wall']) >= min_time:
+        if current['wall'] > base['wall'] * (1 + threshold):
+            problems.append(f"wall {base['wall']:.4f} -> {current['wall']:.4f} s")
+        # Fewer nodes (better pruning) lowers nodes/sec without being slower,
+        # so throughput is only compared on the same search tree
+        if (current['nodes'] == base['nodes']
+                and current['nodes_per_sec'] * (1 + threshold) < base['nodes_per_sec']):
+            problems.append(f"nodes/sec {base['nodes_per_sec']:.0f} -> "
+                            f"{current['nodes_per_sec']:.0f}")
+    return problems
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Benchmark runner with stored baselines')
+    arg_parser.add_argument('--baseline', default=BASELINE_FILE,
+                            help='Baseline JSON (default bench_baseline.json)')
+    arg_parser.add_argument('--update', action='store_true',
+                            help='Write the results as the new baseline')
+    arg_parser.add_argument('--threshold', type=float, default=0.25,
+                            help='Allowed relative regression (default 0.25 = 25%%)')
+    arg_parser.add_argument('--min-time', type=float, default=0.05,
+                            help='Ignore timing changes of cases faster than this (s)')
+    arg_parser.add_argument('--min-mem', type=int, default=64 * 1024,
+                            help='Ignore peak memory growth smaller than this (bytes)')
+    arg_parser.add_argument('--repeat', type=int, default=5,
+                            help='Timed runs per case, best is kept (default 5)')
+    arg_parser.add_argument('--filter', default='',
+                            help='Only run cases whose name contains this text')
+    args = arg_parser.parse_args()
+
+    baseline = {}
+    if not args.update:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)['cases']
+        except FileNotFoundError:
+            print(f"No baseline at {args.baseline}; run with --update first.")
+            return 1
+
+    cases = [(name, run) for name, run in build_cases(load_workload())
+             if args.filter in name]
+
+    print(f"{'Case':<46}{'Wall (s)':>10}{'Nodes':>10}{'Nodes/s':>12}{'Peak':>10}  Status")
+    print("-" * 98)
+    results, failures = {}, 0
+    for name, run in cases:
+        current = measure(run, args.repeat)
+        results[name] = current
+        status = 'NEW'
+        if name in baseline:
+            regressions = compare(current, baseline[name], args.threshold,
+                                  args.min_time, args.min_mem)
+            status = 'OK' if not regressions else 'REGRESSED: ' + '; '.join(regressions)
+            failures += bool(regressions)
+        print(f"{name:<46}{current['wall']:>10.4f}{current['nodes']:>10}"
+              f"{current['nodes_per_sec']:>12.0f}{current['peak_bytes'] // 1024:>8}KB  {status}")
+
+    if args.update:
+        data = {
+            'version': BASELINE_VERSION,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cases': results,
+        }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline written to {args.baseline} ({len(results)} cases)")
+        return 0
+
+    print(f"\n{len(cases) - failures}/{len(cases)} cases within "
+          f"{args.threshold:.0%} of baseline")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
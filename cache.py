@@ -0,0 +1,255 @@
+"""
+cache.py - Persistent Result Cache
+
+This module remembers finished answers on disk so that re-running the same
+query (same problem, same parameters, same solver code) returns instantly.
+
+Key design:
+- Content-addressed: the key is a SHA-256 over the NORMALIZED problem
+  (assignments sorted by ID, dependencies sorted), the query parameters,
+  and a digest of the solver source files, including every local module
+  they import. Reformatting an input file does not miss the cache;
+  upgrading the solver code (or a helper it imports) does.
+- One JSON file per entry: <dir>/<key[:2]>/<key>.json, written atomically.
+- Size-bounded: a running total of the entry sizes is kept in <dir>/SIZE,
+  so a put does not re-scan the directory. Only when the total passes
+  max_bytes is the directory walked: the least recently used entries (by
+  file mtime, refreshed on every hit) are deleted down to 90% of max_bytes
+  and the total is recounted. Concurrent writers may lose an update to the
+  total; the next walk corrects it.
+- Per-entry cap: a value whose JSON exceeds max_entry_bytes is not stored,
+  so one huge enumeration cannot evict everything else.
+
+Location and sizes can be set with the environment variables
+AAI_CACHE_DIR (default ~/.cache/aai-scheduler), AAI_CACHE_MAX_BYTES
+(default 256 MB) and AAI_CACHE_MAX_ENTRY_BYTES (default max_bytes / 16).
+Every driver offers --no-cache to bypass it.
+
+Author: AAI Assignment 1
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+from typing import Iterable, Optional, Set
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aai-scheduler')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ENTRY_FRACTION = 16   # default per-entry cap is max_bytes / ENTRY_FRACTION
+LOW_WATER = 0.9       # eviction trims the cache to this fraction of max_bytes
+SIZE_FILE = 'SIZE'
+
+
+def normalize_problem(assignments: dict) -> list:
+    """
+    Canonical form of a problem: [(id, prompts, sorted deps), ...] by ID.
+
+    Accepts both representations used in this repository: Assignment
+    objects (main.py) and {'prompts', 'deps'} dicts (assg02.py / assg03.py).
+    """
+    rows = []
+    for aid in sorted(assignments):
+        a = assignments[aid]
+        if isinstance(a, dict):
+            rows.append((aid, a['prompts'], sorted(a['deps'])))
+        else:
+            rows.append((aid, a.prompt_count, sorted(a.dependencies)))
+    return rows
+
+
+def local_imports(path: str) -> Set[str]:
+    """Names of the modules in this directory imported anywhere in a source file."""
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split('.')[0])
+    return {name for name in names if os.path.isfile(os.path.join(SOURCE_DIR, name + '.py'))}
+
+
+def source_digest(module_names: Iterable[str]) -> str:
+    """
+    Hash the source files of the given (already imported) modules and of
+    every module in this directory they import, transitively.
+
+    Mixed into every key so answers computed by older code are never reused;
+    following the imports means a helper module added later is covered too.
+    """
+    paths, pending = {}, [sys.modules[name].__file__ for name in module_names]
+    while pending:
+        path = os.path.abspath(pending.pop())
+        if path in paths:
+            continue
+        paths[path] = os.path.splitext(os.path.basename(path))[0]
+        pending.extend(os.path.join(SOURCE_DIR, name + '.py') for name in local_imports(path))
+    digest = hashlib.sha256()
+    for path in sorted(paths, key=paths.get):
+        digest.update(paths[path].encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def cache_key(assignments: dict, *params) -> str:
+    """
+    Content address of (normalized problem, query parameters).
+
+    Args:
+        assignments: Problem in either representation
+        *params: Everything else that determines the answer (tool name,
+                 N, K, M, mode, case, costs, algorithm, source digest, ...)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps([normalize_problem(assignments), params], separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk JSON cache with size-based LRU eviction.
+
+    A disabled cache (enabled=False, i.e. --no-cache) never reads or writes.
+
+    Attributes:
+        directory: Root directory of the cache
+        max_bytes: Total size above which a put evicts old entries
+        max_entry_bytes: Largest single entry that is stored at all
+        enabled: False to bypass the cache entirely
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        enabled: bool = True,
+        max_entry_bytes: Optional[int] = None
+    ):
+        self.directory = directory or os.environ.get('AAI_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.environ.get('AAI_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+        self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else int(
+            os.environ.get('AAI_CACHE_MAX_ENTRY_BYTES', self.max_bytes // ENTRY_FRACTION))
+        self.enabled = enabled
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, key: str):
+        """Return the stored value, or None on a miss (or unreadable entry)."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._remove(path)  # Corrupt entry: drop it, recompute
+            return None
+        try:
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value) -> None:
+        """
+        Store a JSON-serializable value, then evict if over max_bytes.
+
+        Values larger than max_entry_bytes are skipped: the encoder output
+        is streamed to a temporary file and abandoned once it passes the cap.
+        """
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            size = 0
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for chunk in json.JSONEncoder(separators=(',', ':')).iterencode(value):
+                    size += len(chunk)  # ASCII: ensure_ascii escapes the rest
+                    if size > self.max_entry_bytes:
+                        break
+                    f.write(chunk)
+            if size > self.max_entry_bytes:
+                self._remove(tmp_path)
+                return
+            try:
+                size -= os.stat(path).st_size  # overwriting an existing entry
+            except OSError:
+                pass
+            total = self._read_total() + size
+            os.replace(tmp_path, path)
+            if total > self.max_bytes:
+                total = self._evict()
+            self._write_total(total)
+        except OSError:
+            self._remove(tmp_path)  # A cache that cannot write is just a slower run
+
+    def _read_total(self) -> int:
+        """Running total of the entry sizes; recounted if missing or unreadable."""
+        try:
+            with open(os.path.join(self.directory, SIZE_FILE), 'r', encoding='utf-8') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return self._scan()[1]
+
+    def _write_total(self, total: int) -> None:
+        path = os.path.join(self.directory, SIZE_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(str(max(total, 0)))
+        os.replace(tmp_path, path)
+
+    def _scan(self):
+        """Walk the directory: ([(mtime, size, path), ...], total size)."""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        return entries, total
+
+    def _evict(self) -> int:
+        """
+        Delete least recently used entries until under LOW_WATER * max_bytes.
+
+        Trimming below the limit means the next walk is many puts away.
+
+        Returns:
+            The recounted total size after eviction
+        """
+        entries, total = self._scan()
+        if total <= self.max_bytes:
+            return total
+        for _, size, path in sorted(entries):
+            self._remove(path)
+            total -= size
+            if total <= self.max_bytes * LOW_WATER:
+                break
+        return total
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
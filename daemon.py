@@ -0,0 +1,348 @@
+"""
+daemon.py - Long-Running Scheduler Daemon
+
+Answers many small queries without paying for an interpreter start, a parse
+and a graph rebuild every time. The daemon listens on a Unix socket (or a
+localhost TCP port) and speaks newline-delimited JSON:
+
+    request:  {"id": 7, "op": "count", "file": "input01.txt", "M": 5}
+    response: {"id": 7, "ok": true, "result": {"count": 848, "packed": 4, "relaxed": 844}}
+
+Operations (N and K default to the values in the input file):
+    enumerate    M, packed_only            → all schedules (solver.solve)
+    count        M, packed_only            → schedule counts only
+    min-days     K, mode (1|2)             → assg02.find_min_days
+                 budget, c1, c2, case, algo → assg03.find_days (if budget given)
+    min-prompts  M, mode (1|2)             → assg02.find_min_prompts
+    min-cost     M, c1, c2, case, algo     → assg03.find_cost
+    stats                                  → daemon counters
+
+What stays warm:
+- Parsed problems (both representations) per worker process, re-read only
+  when the file's mtime or size changes
+- Finished answers in an in-memory LRU in the daemon itself, so a repeated
+  what-if query never reaches a worker. The LRU is bounded in entries and in
+  bytes (size of the JSON result, --memo-bytes, default 64 MB); like the
+  on-disk cache, a result over 1/16 of that (a large 'enumerate') is
+  answered but not kept
+
+Searches run on a process pool. Requests on one connection are handled
+concurrently and answered as they finish; use "id" to match responses.
+
+Usage:
+    python daemon.py serve [--socket PATH | --port N] [--workers N] [--memo-bytes B]
+    python daemon.py query [--socket PATH | --port N] '{"op": ...}' ...
+    (query reads one JSON request per line from stdin when none are given)
+
+Author: AAI Assignment 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import assg02
+import assg03
+from cache import ENTRY_FRACTION
+from feasibility import check_feasibility
+from graph import find_interchangeable_classes
+from parser import parse_input, validate_dependencies
+from solver import solve, count_schedules, expand_schedules
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'aai-scheduler.sock')
+MEMO_SIZE = 4096
+MEMO_BYTES = 64 * 1024 * 1024
+
+OPERATIONS = ('enumerate', 'count', 'min-days', 'min-prompts', 'min-cost', 'stats')
+
+
+# =============================================================================
+# Worker side (runs inside the process pool)
+# =============================================================================
+
+# Per-process warm problems: path → (stamp, N, K, assignments, assg-style dicts)
+_PROBLEMS: Dict[str, tuple] = {}
+
+
+def file_stamp(path: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file; changes whenever the file is edited."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load_problem(path: str) -> tuple:
+    """
+    Parse an input file once per process and keep it until it changes.
+
+    Returns:
+        (stamp, N, K, assignments, asgn) where asgn is the {'prompts', 'deps'}
+        form used by assg02.py / assg03.py
+
+    Raises:
+        ValueError: If the file is malformed or has a dependency cycle
+    """
+    stamp = file_stamp(path)
+    entry = _PROBLEMS.get(path)
+    if entry is None or entry[0] != stamp:
+        N, K, assignments = parse_input(path)
+        validate_dependencies(assignments)
+        asgn = {aid: {'prompts': a.prompt_count, 'deps': a.dependencies}
+                for aid, a in assignments.items()}
+        if assg02.has_cycle(asgn):
+            raise ValueError("Dependency graph contains a cycle")
+        entry = (stamp, N, K, assignments, asgn)
+        _PROBLEMS[path] = entry
+    return entry
+
+
+def execute(request: dict):
+    """
+    Answer one query (called in a worker process).
+
+    Raises:
+        KeyError: If a required parameter is missing
+        ValueError: On a bad file or parameter value
+    """
+    op = request['op']
+    _, file_N, file_K, assignments, asgn = load_problem(request['file'])
+    N = request.get('N', file_N)
+    K = request.get('K', file_K)
+
+    if op in ('enumerate', 'count'):
+        M = request['M']
+        errors = check_feasibility(assignments, N, K, M)
+        # Symmetry-reduced search; 'count' never expands the schedules
+        solutions = [] if errors else solve(assignments, N, K, M, expand=False,
+                                            packed_only=request.get('packed_only', False))
+        classes = find_interchangeable_classes(assignments)
+        packed, relaxed = count_schedules(solutions, classes)
+        result = {'count': packed + relaxed, 'packed': packed,
+                  'relaxed': relaxed, 'errors': errors}
+        if op == 'enumerate':
+            result['schedules'] = [[schedule, is_packed] for schedule, is_packed
+                                   in expand_schedules(solutions, classes)]
+        return result
+
+    if op == 'min-days' and 'budget' in request:
+        days, nodes, scheme = assg03.find_days(
+            asgn, N, request.get('case', 'A'), request['budget'],
+            request['c1'], request['c2'], len(asgn), request.get('algo', 'astar'))
+        return {'days': days, 'scheme': scheme, 'nodes': nodes}
+
+    if op == 'min-days':
+        return {'days': assg02.find_min_days(asgn, N, K, request.get('mode', 1))}
+
+    if op == 'min-prompts':
+        return {'prompts': assg02.find_min_prompts(asgn, N, request['M'], request.get('mode', 1))}
+
+    if op == 'min-cost':
+        cost, nodes, scheme = assg03.find_cost(
+            asgn, N, request.get('case', 'A'), request['M'],
+            request['c1'], request['c2'], request.get('algo', 'astar'))
+        return {'cost': cost, 'scheme': scheme, 'nodes': nodes}
+
+    raise ValueError(f"Unknown op '{op}', expected one of {OPERATIONS}")
+
+
+# =============================================================================
+# Daemon side (asyncio server)
+# =============================================================================
+
+class SchedulerDaemon:
+    """
+    Accepts JSON-lines connections and dispatches queries to a process pool.
+
+    Attributes:
+        pool: Worker processes running execute()
+        memo: LRU of finished answers, keyed by (request, file stamp),
+              holding (result, JSON size in bytes)
+        memo_bytes: Total size the memo is kept under
+        counters: Request / memo hit / error totals (op 'stats')
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        memo_size: int = MEMO_SIZE,
+        memo_bytes: int = MEMO_BYTES
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.memo: OrderedDict = OrderedDict()
+        self.memo_size = memo_size
+        self.memo_bytes = memo_bytes
+        self.memo_used = 0
+        self.counters = {'requests': 0, 'memo_hits': 0, 'errors': 0}
+
+    async def answer(self, request: dict):
+        """Result for one request: from the memo, or computed on the pool."""
+        if request.get('op') == 'stats':
+            return dict(self.counters, memo_entries=len(self.memo), memo_bytes=self.memo_used)
+        if request.get('op') not in OPERATIONS:
+            raise ValueError(f"Unknown op '{request.get('op')}', expected one of {OPERATIONS}")
+        path = os.path.abspath(request['file'])
+        request = dict(request, file=path)
+        request.pop('id', None)
+
+        # The stamp makes an edited file miss the memo automatically
+        key = (json.dumps(request, sort_keys=True), file_stamp(path))
+        if key in self.memo:
+            self.counters['memo_hits'] += 1
+            self.memo.move_to_end(key)
+            return self.memo[key][0]
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.pool, execute, request)
+        self.remember(key, result)
+        return result
+
+    def remember(self, key, result) -> None:
+        """Memoize a result, evicting least recently used ones to fit."""
+        size = len(json.dumps(result))
+        if size > self.memo_bytes // ENTRY_FRACTION:
+            return  # One huge enumeration must not flush everything else
+        if key in self.memo:
+            self.memo_used -= self.memo.pop(key)[1]
+        self.memo[key] = (result, size)
+        self.memo_used += size
+        while len(self.memo) > self.memo_size or self.memo_used > self.memo_bytes:
+            self.memo_used -= self.memo.popitem(last=False)[1][1]
+
+    async def handle_connection(self, reader, writer) -> None:
+        """Serve one client: every line is an independent request."""
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line: bytes) -> None:
+            self.counters['requests'] += 1
+            response = {}
+            try:
+                request = json.loads(line)
+                if 'id' in request:
+                    response['id'] = request['id']
+                response['result'] = await self.answer(request)
+                response['ok'] = True
+            except KeyError as e:
+                self.counters['errors'] += 1
+                response.update(ok=False, error=f"Missing parameter {e}")
+            except Exception as e:  # Report every failure to the client
+                self.counters['errors'] += 1
+                response.update(ok=False, error=f"{type(e).__name__}: {e}")
+            async with lock:
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                await writer.drain()
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.strip():
+                task = asyncio.ensure_future(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        writer.close()
+
+    async def serve(self, socket_path: Optional[str], port: Optional[int]) -> None:
+        """Listen until interrupted."""
+        # Start the workers BEFORE listening: forked later, they would inherit
+        # client sockets and keep those connections from ever closing
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, os.getpid)
+                               for _ in range(self.workers)))
+        if port is not None:
+            server = await asyncio.start_server(self.handle_connection, '127.0.0.1', port)
+            where = f"127.0.0.1:{port}"
+        else:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)  # Stale socket from a previous run
+            server = await asyncio.start_unix_server(self.handle_connection, socket_path)
+            where = socket_path
+        print(f"Scheduler daemon listening on {where}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+# =============================================================================
+# Client helper
+# =============================================================================
+
+def query(
+    requests: List[dict],
+    socket_path: Optional[str] = DEFAULT_SOCKET,
+    port: Optional[int] = None
+) -> List[dict]:
+    """
+    Send requests over one connection and collect all responses.
+
+    Responses arrive in completion order; requests without an "id" are
+    numbered 0, 1, ... so callers can still match them up.
+    """
+    requests = [dict(r, id=r.get('id', i)) for i, r in enumerate(requests)]
+    if port is not None:
+        conn = socket.create_connection(('127.0.0.1', port))
+    else:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.connect(socket_path)
+    with conn, conn.makefile('rwb') as stream:
+        for request in requests:
+            stream.write(json.dumps(request).encode('utf-8') + b'\n')
+        stream.flush()
+        conn.shutdown(socket.SHUT_WR)
+        responses = []
+        while len(responses) < len(requests):
+            line = stream.readline()
+            if not line:
+                break  # Daemon went away
+            responses.append(json.loads(line))
+        return responses
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Scheduler daemon with warm problem state')
+    sub = arg_parser.add_subparsers(dest='command', required=True)
+    for name in ('serve', 'query'):
+        cmd = sub.add_parser(name)
+        where = cmd.add_mutually_exclusive_group()
+        where.add_argument('--socket', default=DEFAULT_SOCKET,
+                           help=f'Unix socket path (default {DEFAULT_SOCKET})')
+        where.add_argument('--port', type=int, help='Use localhost TCP instead')
+        if name == 'serve':
+            cmd.add_argument('--workers', type=int, help='Worker processes (default: CPUs)')
+            cmd.add_argument('--memo-bytes', type=int, default=MEMO_BYTES,
+                             help='Size bound of the in-memory answer memo (default 64 MB)')
+        else:
+            cmd.add_argument('requests', nargs='*', help='JSON requests (default: stdin lines)')
+    args = arg_parser.parse_args()
+
+    if args.command == 'serve':
+        daemon = SchedulerDaemon(args.workers, memo_bytes=args.memo_bytes)
+        try:
+            asyncio.run(daemon.serve(args.socket, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            daemon.pool.shutdown(cancel_futures=True)
+        return 0
+
+    lines = args.requests or [line for line in sys.stdin if line.strip()]
+    try:
+        requests = [json.loads(line) for line in lines]
+    except json.JSONDecodeError as e:
+        print(f"Error: invalid JSON request: {e}")
+        return 1
+    for response in query(requests, args.socket, args.port):
+        print(json.dumps(response))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
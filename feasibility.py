@@ -9,14 +9,25 @@ Checks performed:
 2. Total prompts don't exceed theoretical capacity (N * K * M)
 3. Critical path doesn't exceed M days
 4. Dependency graph has no cycles
+5. Bin packing: the assignments fit into N * M student-days of K prompts
+   (Martello-Toth L2 lower bound on the bins needed)
+6. Dependency chains: the part of a chain done on one day holds at most
+   N * K prompts, so a heavy chain spans several days
+7. Day windows: every group of assignments confined to days x..y by their
+   chains fits into the student-days of x..y
+
+Checks 5-7 are sound lower bounds: they only reject M values for which no
+schedule exists, in time polynomial in the input.
 
 Author: AAI Assignment 1
 """
 
+import math
 from math import ceil
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional
 from models import Assignment
 from graph import has_cycle, compute_critical_path
+from heuristics import bin_packing_bound, MEMO_LIMIT
 
 
 def check_feasibility(
@@ -46,6 +57,8 @@ def check_feasibility(
         ...     print("Problem is feasible, proceeding with search...")
     """
     errors = []
+    cyclic = has_cycle(assignments)
+    fits = all(a.prompt_count <= K for a in assignments.values())
     
     # =========================================================================
     # Check 1: No assignment requires more prompts than K
@@ -96,16 +109,243 @@ def check_feasibility(
     # Check 4: Cycle detection
     # =========================================================================
     # A cycle in dependencies means the problem is ill-formed.
-    if has_cycle(assignments):
+    if cyclic:
         errors.append(
             "Dependency graph contains a cycle. "
             "This is an invalid problem definition - assignments cannot "
             "have circular dependencies."
         )
+        return errors  # Checks 6-7 need a topological order
+    
+    # =========================================================================
+    # Check 5: Bin packing on student-days
+    # =========================================================================
+    # Each assignment is done by one student on one day, so a schedule packs
+    # the prompt counts into N * M bins of capacity K. Check 2 only compares
+    # volumes; L2 also counts items too large to share a bin.
+    if fits:
+        bins = bin_packing_bound([a.prompt_count for a in assignments.values()], K)
+        if bins > N * M:
+            errors.append(
+                f"The assignments need at least {bins} student-days of K={K} "
+                f"prompts (bin packing bound), but only N={N} × M={M} = {N * M} "
+                f"are available."
+            )
+    
+    # =========================================================================
+    # Check 6: Heavy dependency chains
+    # =========================================================================
+    # Unlike the critical path, this IS a hard bound: all students together
+    # do at most N * K prompts of a chain per day, so a chain needs as many
+    # days as its greedy cut into pieces of <= N * K prompts.
+    windows = day_windows(assignments, N, K, M)
+    for aid, (first, last) in windows.items():
+        if first > last:
+            errors.append(
+                f"Assignment {aid} lies on a dependency chain that needs at least "
+                f"{first + M - last} days (at most N={N} × K={K} = {N * K} prompts "
+                f"of a chain fit in one day), but M={M}."
+            )
+            break
+    
+    # =========================================================================
+    # Check 7: Day-window capacity
+    # =========================================================================
+    # Assignments whose window lies inside days x..y must all fit into the
+    # N * (y - x + 1) student-days of that interval.
+    if fits and not errors:
+        violation = window_overload(assignments, windows, N, K)
+        if violation:
+            x, y, bins = violation
+            errors.append(
+                f"Dependencies force assignments into days {x}..{y}, which need at "
+                f"least {bins} student-days of K={K} prompts, but only "
+                f"N={N} × {y - x + 1} day(s) = {N * (y - x + 1)} are available."
+            )
     
     return errors
 
 
+def min_days_bound(
+    assignments: Dict[int, Assignment],
+    N: int,
+    K: int
+) -> Optional[int]:
+    """
+    Lower bound on the days any schedule needs (checks 2, 5 and 6 without M).
+    
+    Returns:
+        The bound, or None if an assignment exceeds K or the graph has a cycle
+    """
+    if has_cycle(assignments) or any(a.prompt_count > K for a in assignments.values()):
+        return None
+    sizes = [a.prompt_count for a in assignments.values()]
+    windows = DayWindows(assignments, N * K, 0).windows()
+    return max(ceil(sum(sizes) / (N * K)), ceil(bin_packing_bound(sizes, K) / N),
+               max((first for first, _ in windows.values()), default=0))
+
+
+def chain_days(
+    prompts: Dict[int, int],
+    capacity: int,
+    order: List[int],
+    links: Dict[int, List[int]]
+) -> Dict[int, int]:
+    """
+    Days spanned by a heavy chain through `links` ending at each assignment.
+    
+    A chain needs at least as many days as its greedy cut into pieces of
+    at most `capacity` prompts (greedy is optimal for a fixed chain). Each
+    assignment extends the linked state with the most pieces, then the
+    fullest last piece, so the value is the exact cut of SOME chain: a
+    sound lower bound, if not always the largest one.
+    
+    Args:
+        prompts: Assignment ID → prompt count
+        capacity: Prompts of one chain that fit into one day
+        order: IDs such that every linked ID comes first
+        links: ID → IDs the chain may come from (dependencies or dependents)
+    
+    Returns:
+        Dictionary mapping assignment ID to days (>= 1)
+    """
+    state: Dict[int, tuple] = {}  # aid -> (pieces, prompts in the last piece)
+    for aid in order:
+        p = prompts[aid]
+        best = (1, p)
+        for other in links[aid]:
+            pieces, used = state[other]
+            best = max(best, (pieces, used + p) if used + p <= capacity else (pieces + 1, p))
+        state[aid] = best
+    return {aid: pieces for aid, (pieces, _) in state.items()}
+
+
+def day_windows(
+    assignments: Dict[int, Assignment],
+    N: int,
+    K: int,
+    M: int
+) -> Dict[int, tuple]:
+    """
+    Earliest and latest day (1-based) each assignment can be scheduled on.
+    
+    The earliest day is the chain bound over its ancestors, the latest is
+    M minus the chain bound over its descendants (plus one). A window with
+    first > last means no schedule within M days exists.
+    
+    Raises:
+        ValueError: If the graph has a cycle
+    """
+    return DayWindows(assignments, N * K, M).windows()
+
+
+class DayWindows:
+    """
+    ASAP / ALAP day windows, re-tightened as a search commits assignments.
+    
+    The latest day of an assignment only depends on its descendants, which
+    are all still open while it is, so it is fixed up front. The earliest
+    day depends on which ancestors are done: from a search state on `day`,
+    an open assignment cannot come before day - 1 + the chain bound over
+    its OPEN ancestors. A state is dead as soon as some window is empty;
+    last_start() memoizes, per completed set, the last day that still works.
+    
+    Accepts both representations used in this repository: Assignment
+    objects (main.py) and {'prompts', 'deps'} dicts (assg02.py).
+    
+    Attributes:
+        capacity: Prompts of one chain that fit into one day - N * K when
+                  results are shared at once (a chain may move between
+                  students), K when they reach others only the next day
+        latest: Assignment ID → latest day
+    """
+    
+    def __init__(self, assignments: dict, capacity: int, M: int):
+        self.capacity = capacity
+        self.prompts: Dict[int, int] = {}
+        self.deps: Dict[int, List[int]] = {}
+        for aid, a in assignments.items():
+            if isinstance(a, dict):
+                self.prompts[aid], deps = a['prompts'], a['deps']
+            else:
+                self.prompts[aid], deps = a.prompt_count, a.dependencies
+            self.deps[aid] = [d for d in deps if d in assignments]
+        self.dependents: Dict[int, List[int]] = {aid: [] for aid in assignments}
+        for aid in sorted(assignments):
+            for dep_id in self.deps[aid]:
+                self.dependents[dep_id].append(aid)
+        self.order = self._topological_order()
+        after = chain_days(self.prompts, capacity, self.order[::-1], self.dependents)
+        self.latest = {aid: M - after[aid] + 1 for aid in self.order}
+        self._memo: Dict[FrozenSet[int], float] = {}
+    
+    def _topological_order(self) -> List[int]:
+        indegree = {aid: len(deps) for aid, deps in self.deps.items()}
+        order = [aid for aid in sorted(self.deps) if indegree[aid] == 0]
+        for aid in order:  # grows while we iterate
+            for child in self.dependents[aid]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    order.append(child)
+        if len(order) != len(self.deps):
+            raise ValueError("Graph has a cycle, day windows not possible")
+        return order
+    
+    def windows(self) -> Dict[int, tuple]:
+        """(earliest, latest) day of every assignment before the search starts."""
+        before = chain_days(self.prompts, self.capacity, self.order, self.deps)
+        return {aid: (before[aid], self.latest[aid]) for aid in self.order}
+    
+    def last_start(self, completed: FrozenSet[int]) -> float:
+        """Last day a search with these assignments done can still finish (inf if all done)."""
+        value = self._memo.get(completed)
+        if value is None:
+            if len(self._memo) >= MEMO_LIMIT:
+                self._memo.clear()
+            order = [aid for aid in self.order if aid not in completed]
+            deps = {aid: [d for d in self.deps[aid] if d not in completed] for aid in order}
+            before = chain_days(self.prompts, self.capacity, order, deps)
+            value = self._memo[completed] = min(
+                (self.latest[aid] - before[aid] + 1 for aid in order), default=math.inf)
+        return value
+    
+    def is_open(self, completed: FrozenSet[int], day: int) -> bool:
+        """False if some open assignment can no longer meet its window."""
+        return day <= self.last_start(completed)
+
+
+def window_overload(
+    assignments: Dict[int, Assignment],
+    windows: Dict[int, tuple],
+    N: int,
+    K: int
+) -> Optional[tuple]:
+    """
+    First day interval x..y that cannot hold the assignments confined to it.
+    
+    Only intervals from an earliest day to a latest day need checking; the
+    demand of an interval is the L2 bin packing bound of its assignments.
+    
+    Returns:
+        (x, y, student-days needed), or None if every interval fits
+    """
+    starts = sorted({first for first, _ in windows.values()})
+    ends = sorted({last for _, last in windows.values()})
+    for x in starts:
+        for y in ends:
+            if y < x:
+                continue
+            sizes = [assignments[aid].prompt_count for aid, (first, last)
+                     in windows.items() if first >= x and last <= y]
+            # L2 never exceeds the item count: only crowded intervals can fail
+            if len(sizes) <= N * (y - x + 1):
+                continue
+            bins = bin_packing_bound(sizes, K)
+            if bins > N * (y - x + 1):
+                return x, y, bins
+    return None
+
+
 def print_feasibility_report(
     assignments: Dict[int, Assignment],
     N: int,
@@ -142,6 +382,9 @@ def print_feasibility_report(
     print(f"  - Max daily capacity: {max_daily_capacity}")
     print(f"  - Dependency depth (levels, not days!): {critical_path}")
     print(f"  - Theoretical min days: {ceil(total_prompts / max_daily_capacity)}")
+    bound = min_days_bound(assignments, N, K)
+    if bound is not None:
+        print(f"  - Min days (packing, chains): {bound}")
     
     # Run checks
     errors = check_feasibility(assignments, N, K, M)
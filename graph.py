@@ -5,13 +5,15 @@ This module provides graph-based operations for the assignment dependency struct
 - Cycle detection (validate DAG property)
 - Critical path computation (longest dependency chain)
 - Finding "ready" assignments (dependencies satisfied)
+- Interchangeable assignments (symmetry classes the searches collapse)
 
 The dependency structure forms a Directed Acyclic Graph (DAG).
 
 Author: AAI Assignment 1
 """
 
-from typing import Dict, List, Set
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set
 from models import Assignment
 
 
@@ -189,11 +191,11 @@ def topological_sort(assignments: Dict[int, Assignment]) -> List[int]:
     in_degree = {aid: len(assignments[aid].dependencies) for aid in assignments}
     
     # Start with nodes that have no dependencies
-    queue = [aid for aid, deg in in_degree.items() if deg == 0]
+    queue = deque(aid for aid, deg in in_degree.items() if deg == 0)
     result = []
     
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
         result.append(current)
         
         # Reduce in-degree of dependents
@@ -206,3 +208,120 @@ def topological_sort(assignments: Dict[int, Assignment]) -> List[int]:
         raise ValueError("Graph has a cycle, topological sort not possible")
     
     return result
+
+
+
+def build_dependents(assignments: Dict[int, Assignment]) -> Dict[int, List[int]]:
+    """
+    Build the reverse adjacency list (assignment → assignments that need it).
+    
+    Assignment only stores its dependencies; most forward traversals want
+    the opposite direction. Built once in O(V + E).
+    
+    Args:
+        assignments: Dictionary mapping assignment ID to Assignment
+    
+    Returns:
+        Dictionary mapping assignment ID to the IDs that depend on it
+    """
+    dependents: Dict[int, List[int]] = {aid: [] for aid in assignments}
+    for assignment in assignments.values():
+        for dep_id in assignment.dependencies:
+            dependents[dep_id].append(assignment.id)
+    return dependents
+
+
+def compute_bottom_levels(assignments: Dict[int, Assignment]) -> Dict[int, int]:
+    """
+    Compute, for every assignment, the longest chain of assignments that
+    starts at it (itself included) and runs through its dependents.
+    
+    This is the classic "bottom level" used by list schedulers: the larger it
+    is, the more work is still blocked behind the assignment.
+    
+    Args:
+        assignments: Dictionary mapping assignment ID to Assignment
+    
+    Returns:
+        Dictionary mapping assignment ID to its bottom level (sinks are 1)
+    
+    Raises:
+        ValueError: If the graph has a cycle
+    
+    Example:
+        A1 → A2 → A4 gives {1: 3, 2: 2, 4: 1}
+    """
+    dependents = build_dependents(assignments)
+    levels: Dict[int, int] = {}
+    for aid in reversed(topological_sort(assignments)):
+        levels[aid] = 1 + max((levels[c] for c in dependents[aid]), default=0)
+    return levels
+
+
+def find_interchangeable_classes(
+    assignments: dict,
+    key: Optional[Callable[[int], object]] = None
+) -> List[List[int]]:
+    """
+    Group assignments that can be swapped without changing any schedule.
+    
+    Two assignments are interchangeable when they have the same prompt
+    count, the same dependencies and the same dependents: relabeling one as
+    the other maps every valid schedule onto another valid schedule. A search
+    then only has to try ONE member of a class at each choice point (see
+    symmetry_predecessors), instead of every permutation of the class.
+    
+    Accepts both representations used in this repository: Assignment
+    objects (main.py) and {'prompts', 'deps'} dicts (assg02.py / assg03.py).
+    
+    Args:
+        assignments: Dictionary of all assignments
+        key: Optional extra property members must share, called with the ID
+             (assg03.py passes the LLM type: ChatGPT and Gemini work is not
+             interchangeable there)
+    
+    Returns:
+        Classes with at least two members, each sorted by ID, ordered by
+        their smallest ID
+    
+    Example:
+        A2 and A3 both take 3 prompts, both need A1 and both unlock A4
+        → [[2, 3]]
+    """
+    deps = {aid: (a['deps'] if isinstance(a, dict) else a.dependencies)
+            for aid, a in assignments.items()}
+    dependents: Dict[int, List[int]] = {aid: [] for aid in assignments}
+    for aid in sorted(assignments):
+        for dep_id in deps[aid]:
+            if dep_id in dependents:
+                dependents[dep_id].append(aid)
+    
+    groups: Dict[tuple, List[int]] = {}
+    for aid in sorted(assignments):
+        a = assignments[aid]
+        prompts = a['prompts'] if isinstance(a, dict) else a.prompt_count
+        signature = (prompts, deps[aid], tuple(dependents[aid]),
+                     key(aid) if key else None)
+        groups.setdefault(signature, []).append(aid)
+    
+    return sorted((members for members in groups.values() if len(members) > 1),
+                  key=lambda members: members[0])
+
+
+def symmetry_predecessors(classes: List[List[int]]) -> Dict[int, int]:
+    """
+    Map every class member (except the first) to the member just before it.
+    
+    Canonical order: a member may only be picked once its predecessor is
+    done (or, when several are picked at once, picked too). Any schedule can
+    be relabeled so its members follow this order, so searches that enforce
+    it lose no answers - just the k! copies of each one.
+    
+    Args:
+        classes: Output of find_interchangeable_classes()
+    
+    Returns:
+        Dictionary mapping assignment ID to the previous member of its class
+    """
+    return {members[i]: members[i - 1]
+            for members in classes for i in range(1, len(members))}
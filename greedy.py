@@ -0,0 +1,196 @@
+"""
+greedy.py - Fast List Scheduler
+
+This module produces ONE good schedule quickly, for instances far too large
+for the exhaustive DFS in solver.py (thousands of assignments).
+
+Algorithm Overview:
+1. Rank every assignment by a static priority:
+   - 'cp':      longest chain of dependents still blocked behind it
+   - 'prompts': largest prompt count first
+2. Keep the ready assignments in a pool that returns the highest-ranked one
+   that still FITS the largest remaining student capacity
+3. Best-Fit: give it to the student with the LEAST remaining capacity that
+   can still take it (capacities kept sorted, searched with bisect)
+4. Completing an assignment unlocks its dependents on the same day
+   (instant sharing, exactly as in solver.py)
+5. When nothing in the pool fits anybody, the day ends
+
+Complexity: every assignment enters and leaves the pool once, each in
+O(log V), so the whole schedule costs O((V + E) log V) (plus N per placement
+for the sorted capacity list).
+
+The result is a valid schedule, so its length is an upper bound on the
+minimum number of days; the capacity bound ceil(total / (N*K)) is a lower one.
+
+Author: AAI Assignment 1
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from math import ceil
+from typing import Dict, List
+from models import Assignment
+from graph import build_dependents, compute_bottom_levels
+
+PRIORITIES = ('cp', 'prompts')
+
+
+class _ReadyPool:
+    """
+    Ready assignments bucketed by prompt size.
+    
+    Each bucket is a heap ordered by priority; a segment tree over the sorted
+    distinct sizes holds each bucket's best entry, so "best entry with
+    prompts <= capacity" is a prefix-minimum query in O(log S).
+    Entries are tuples (-rank, -prompts, id); smaller is better.
+    """
+    
+    def __init__(self, sizes):
+        self.sizes = sorted(set(sizes))
+        self.index = {p: i for i, p in enumerate(self.sizes)}
+        self.buckets = [[] for _ in self.sizes]
+        self.width = 1
+        while self.width < len(self.sizes):
+            self.width *= 2
+        self.tree = [None] * (2 * self.width)
+    
+    def push(self, item) -> None:
+        i = self.index[-item[1]]
+        heapq.heappush(self.buckets[i], item)
+        self._refresh(i)
+    
+    def pop_fitting(self, capacity: int):
+        """Remove and return the best entry with prompts <= capacity, or None."""
+        lo, hi = self.width, self.width + bisect_right(self.sizes, capacity)
+        best = None
+        while lo < hi:
+            if lo & 1:
+                best = _better(best, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = _better(best, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        if best is not None:
+            i = self.index[-best[1]]
+            heapq.heappop(self.buckets[i])
+            self._refresh(i)
+        return best
+    
+    def _refresh(self, i: int) -> None:
+        bucket = self.buckets[i]
+        pos = self.width + i
+        self.tree[pos] = bucket[0] if bucket else None
+        pos //= 2
+        while pos:
+            self.tree[pos] = _better(self.tree[2 * pos], self.tree[2 * pos + 1])
+            pos //= 2
+
+
+def _better(a, b):
+    """Smaller of two pool entries, treating None as 'empty'."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a if a < b else b
+
+
+def greedy_schedule(
+    assignments: Dict[int, Assignment],
+    N: int,
+    K: int,
+    priority: str = 'cp'
+) -> List[List[int]]:
+    """
+    Build a single schedule with priority list scheduling and Best-Fit packing.
+
+    Args:
+        assignments: Dictionary of all assignments
+        N: Number of students
+        K: Prompts per student per day
+        priority: 'cp' (critical path first) or 'prompts' (largest first)
+
+    Returns:
+        Schedule as [[day1_assignments], [day2_assignments], ...]
+
+    Raises:
+        ValueError: If the graph has a cycle, the priority is unknown, or an
+                    assignment needs more than K prompts
+    """
+    if priority == 'cp':
+        rank = compute_bottom_levels(assignments)
+    elif priority == 'prompts':
+        rank = {aid: a.prompt_count for aid, a in assignments.items()}
+    else:
+        raise ValueError(f"Unknown priority '{priority}', expected one of {PRIORITIES}")
+
+    for assignment in assignments.values():
+        if assignment.prompt_count > K:
+            raise ValueError(
+                f"Assignment {assignment.id} requires {assignment.prompt_count} "
+                f"prompts, but K={K}"
+            )
+
+    dependents = build_dependents(assignments)
+    waiting = {aid: len(a.dependencies) for aid, a in assignments.items()}
+
+    def entry(aid: int):
+        # Highest rank first, then larger prompts, then lower ID for determinism
+        return (-rank[aid], -assignments[aid].prompt_count, aid)
+
+    ready = _ReadyPool(a.prompt_count for a in assignments.values())
+    for aid, count in waiting.items():
+        if count == 0:
+            ready.push(entry(aid))
+    schedule: List[List[int]] = []
+
+    while True:
+        capacities = [K] * N  # Sorted ascending for Best-Fit lookups
+        today: List[int] = []
+
+        # Highest-ranked ready assignment that the roomiest student can take
+        item = ready.pop_fitting(capacities[-1])
+        while item is not None:
+            aid = item[2]
+            prompts = assignments[aid].prompt_count
+
+            # Best-Fit: tightest student that still has room
+            i = bisect_left(capacities, prompts)
+            insort(capacities, capacities.pop(i) - prompts)
+            today.append(aid)
+
+            # Instant sharing: dependents may start later today
+            for child in dependents[aid]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    ready.push(entry(child))
+
+            item = ready.pop_fitting(capacities[-1])
+
+        if not today:
+            break
+        schedule.append(sorted(today))
+
+    if sum(len(day) for day in schedule) != len(assignments):
+        raise ValueError("Graph has a cycle, no schedule is possible")
+
+    return schedule
+
+
+def capacity_lower_bound(assignments: Dict[int, Assignment], N: int, K: int) -> int:
+    """
+    Minimum days implied by total prompts alone: ceil(total / (N * K)).
+
+    Args:
+        assignments: Dictionary of all assignments
+        N: Number of students
+        K: Prompts per student per day
+
+    Returns:
+        Lower bound on the number of days of any schedule
+    """
+    total_prompts = sum(a.prompt_count for a in assignments.values())
+    return ceil(total_prompts / (N * K))
@@ -0,0 +1,166 @@
+"""
+heuristics.py - Admissible Day Bounds for Assignment 3
+
+Lower bounds on how many more days the remaining assignments need under a
+subscription scheme (g ChatGPT + h Gemini prompts per day, N students).
+assg03.py uses their maximum as the A* / IDA* heuristic and DFBB prunes
+with it against the incumbent and the deadline M.
+
+Bounds:
+- Prompt volume:   ceil(remaining prompts of a type / daily prompts of it)
+- Bin packing:     each assignment is solved within a single day, so per
+                   type the days are bins of capacity g (or h); we use the
+                   Martello-Toth L2 bound, which dominates prompt volume
+- Case A only:
+  - Students:      ceil(remaining assignments / N), one per student per day
+  - Critical path: a dependency chain needs one day per assignment
+- Case B only:
+  - Chain segments: dependents may be chained within a day, but the part of
+                   a chain done on one day must fit g and h together, so a
+                   chain needs at least its greedy segment count of days
+
+Every bound is admissible (never overestimates). The Case A bounds also
+drop by at most one per day (consistent), which astar_A relies on since it
+never reopens a completed set; Case B's A* keys states by (day, done), so
+there admissibility is enough.
+
+Author: AAI Assignment 1
+"""
+
+import math
+from typing import Dict, FrozenSet, List
+
+MEMO_LIMIT = 1 << 16  # cached bounds per DayBound before the memo is reset
+
+
+def _is_chatgpt(aid: int) -> bool:
+    """Even ids go to ChatGPT, odd ids to Gemini (see assg03.llm_type)."""
+    return aid % 2 == 0
+
+
+def _ceil_div(total: int, capacity: int) -> float:
+    if capacity <= 0:
+        return math.inf if total > 0 else 0
+    return -(-total // capacity)
+
+
+def bin_packing_bound(sizes: List[int], capacity: int) -> float:
+    """
+    Martello-Toth L2 lower bound on the bins of `capacity` needed for `sizes`.
+
+    For every alpha in {0} ∪ {sizes <= capacity/2}:
+        J1 = sizes > capacity - alpha          (each needs its own bin)
+        J2 = capacity/2 < sizes <= capacity - alpha  (one per bin)
+        J3 = alpha <= sizes <= capacity/2      (must go into J2's spare room
+                                                or new bins)
+        L(alpha) = |J1| + |J2| + max(0, ceil((sum J3 - spare in J2) / capacity))
+
+    Returns:
+        max over alpha of L(alpha); inf if an item does not fit at all
+    """
+    if not sizes:
+        return 0
+    if max(sizes) > capacity:
+        return math.inf
+    best = 0
+    for alpha in {0} | {s for s in sizes if 2 * s <= capacity}:
+        big = small = big_count = big_sum = 0
+        for s in sizes:
+            if s > capacity - alpha:
+                big += 1
+            elif 2 * s > capacity:
+                big_count += 1
+                big_sum += s
+            elif s >= alpha:
+                small += s
+        spare = big_count * capacity - big_sum
+        best = max(best, big + big_count + max(0, _ceil_div(small - spare, capacity)))
+    return best
+
+
+class DayBound:
+    """
+    Admissible lower bound on the remaining days, as a callable: bound(done).
+
+    Attributes:
+        case: 'A' (one assignment per student per day) or 'B' (chaining)
+        order: Assignment ids in topological order
+    """
+
+    def __init__(self, asgn: Dict[int, dict], N: int, g: int, h: int, case: str):
+        self.asgn, self.N, self.g, self.h, self.case = asgn, N, g, h, case
+        self.children: Dict[int, List[int]] = {aid: [] for aid in asgn}
+        for aid, data in asgn.items():
+            for dep in data['deps']:
+                if dep in self.children:
+                    self.children[dep].append(aid)
+        self.order = self._topological_order()
+        self._memo: Dict[FrozenSet[int], float] = {}
+
+    def _topological_order(self) -> List[int]:
+        indegree = {aid: sum(1 for d in data['deps'] if d in self.asgn)
+                    for aid, data in self.asgn.items()}
+        order = [aid for aid in sorted(self.asgn) if indegree[aid] == 0]
+        for aid in order:  # grows while we iterate
+            for child in self.children[aid]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    order.append(child)
+        return order
+
+    def __call__(self, done: FrozenSet[int]) -> float:
+        value = self._memo.get(done)
+        if value is None:
+            if len(self._memo) >= MEMO_LIMIT:
+                self._memo.clear()
+            value = self._memo[done] = self._compute(done)
+        return value
+
+    def _compute(self, done: FrozenSet[int]) -> float:
+        gpt = [self.asgn[a]['prompts'] for a in self.asgn if a not in done and _is_chatgpt(a)]
+        gem = [self.asgn[a]['prompts'] for a in self.asgn if a not in done and not _is_chatgpt(a)]
+        bound = max(bin_packing_bound(gpt, self.g), bin_packing_bound(gem, self.h))
+        if self.case == 'A':
+            bound = max(bound, _ceil_div(len(gpt) + len(gem), self.N),
+                        self.critical_path(done))
+        else:
+            bound = max(bound, self.chain_segments(done))
+        return bound
+
+    def critical_path(self, done: FrozenSet[int]) -> int:
+        """Longest chain of remaining assignments (in assignments)."""
+        height: Dict[int, int] = {}
+        for aid in reversed(self.order):
+            if aid not in done:
+                height[aid] = 1 + max((height[c] for c in self.children[aid] if c in height),
+                                      default=0)
+        return max(height.values(), default=0)
+
+    def chain_segments(self, done: FrozenSet[int]) -> int:
+        """
+        Days needed by one remaining chain when cut into same-day segments.
+
+        Greedy cutting (extend today's segment while it fits g and h) is
+        optimal for a fixed chain. Each assignment extends the predecessor
+        state with the most segments (then the fullest day), so the result
+        is the exact greedy count of SOME chain - a valid bound, if not
+        always the largest one.
+        """
+        state: Dict[int, tuple] = {}  # aid -> (segments, ChatGPT used, Gemini used)
+        best = 0
+        for aid in self.order:
+            if aid in done:
+                continue
+            p = self.asgn[aid]['prompts']
+            pg, pm = (p, 0) if _is_chatgpt(aid) else (0, p)
+            options = [(1, pg, pm)]
+            for dep in self.asgn[aid]['deps']:
+                if dep in state:
+                    s, ug, um = state[dep]
+                    if ug + pg <= self.g and um + pm <= self.h:
+                        options.append((s, ug + pg, um + pm))
+                    else:
+                        options.append((s + 1, pg, pm))
+            state[aid] = max(options, key=lambda o: (o[0], o[1] + o[2]))
+            best = max(best, state[aid][0])
+        return best
@@ -0,0 +1,195 @@
+"""
+incremental.py - Incremental Re-Solve After Small Input Edits
+
+solver.solve spends nearly all its time packing days: from each start-of-day
+state it tries every order of adding ready assignments. The DAY OPTIONS of
+a start-of-day state - the distinct (assignments done that day, day ended
+Packed?) outcomes - depend only on:
+- the set C of assignments completed before the day, and
+- the prompts and dependencies of the assignments NOT in C (plus N, K and
+  the interchangeable classes)
+They do not depend on M, or on anything about the assignments in C.
+
+So the options are saved in a state file, keyed by C. When the input is
+edited, the new problem is diffed against the saved one, assignment by
+assignment. Options of C are still valid if every changed assignment is in
+C (it was already done, so its new prompts or dependencies cannot matter);
+everything else is recomputed on demand. Changing N, K, the set of IDs, or
+the interchangeable classes invalidates everything; changing M invalidates
+nothing.
+
+Schedules are then enumerated over the option graph (day by day, up to M)
+in exactly the order solve(expand=False) reports them.
+
+Usage:
+    python main.py <input-file> <days> --incremental state.json
+
+Author: AAI Assignment 1
+"""
+
+import json
+import os
+from typing import Dict, FrozenSet, List, Tuple
+from models import Assignment
+from graph import (get_ready_assignments, find_interchangeable_classes,
+                   symmetry_predecessors)
+from solver import can_fit_assignment, remove_duplicate_schedules
+
+STATE_VERSION = 1
+
+DayOption = Tuple[Tuple[int, ...], bool]  # (assignments done that day, ended Packed)
+
+
+class IncrementalSolver:
+    """
+    Day-option memo for one problem, reusable across edits and day limits.
+
+    Attributes:
+        options: Start-of-day completed set → its day options, in the order
+                 solve() first finishes them
+        reused: Entries taken over from a saved state
+        computed: Entries computed by this solver
+    """
+
+    def __init__(self, assignments: Dict[int, Assignment], N: int, K: int):
+        self.assignments, self.N, self.K = assignments, N, K
+        self.classes = find_interchangeable_classes(assignments)
+        self.predecessor = symmetry_predecessors(self.classes)
+        self.options: Dict[FrozenSet[int], List[DayOption]] = {}
+        self.reused = self.computed = 0
+        self.changed: List[int] = []
+
+    # =========================================================================
+    # State file
+    # =========================================================================
+
+    def _problem(self) -> Dict[str, list]:
+        return {str(aid): [a.prompt_count, sorted(a.dependencies)]
+                for aid, a in self.assignments.items()}
+
+    def load(self, path: str) -> None:
+        """
+        Take over every still-valid entry of a saved state (missing file = none).
+
+        Raises:
+            ValueError: If the file is not an incremental state
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:
+            raise ValueError(f"corrupt state file: {e}")
+        if not isinstance(data, dict) or data.get('version') != STATE_VERSION:
+            raise ValueError("not an incremental state (or written by another version)")
+
+        old, new = data['problem'], self._problem()
+        self.changed = sorted(int(aid) for aid in set(old) | set(new)
+                              if old.get(aid) != new.get(aid))
+        if ((data['N'], data['K']) != (self.N, self.K) or set(old) != set(new)
+                or data['classes'] != self.classes):
+            return
+        changed = set(self.changed)
+        for completed, options in data['options']:
+            if changed.issubset(completed):
+                self.options[frozenset(completed)] = [(tuple(day), packed)
+                                                      for day, packed in options]
+        self.reused = len(self.options)
+
+    def save(self, path: str) -> None:
+        """Atomically write the problem and every known entry."""
+        data = {
+            'version': STATE_VERSION,
+            'N': self.N,
+            'K': self.K,
+            'classes': self.classes,
+            'problem': self._problem(),
+            'options': [[sorted(completed), [[list(day), packed] for day, packed in options]]
+                        for completed, options in self.options.items()],
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def day_options(self, completed: FrozenSet[int]) -> List[DayOption]:
+        """
+        Distinct outcomes of one day started with `completed` done.
+
+        Same transitions as solver.solve (First-Fit, interchangeable
+        assignments in ID order). A day that finishes everything is listed
+        too; its Packed flag is irrelevant (the last day never counts).
+        Options are listed in post-order, i.e. in the order solve() first
+        advances past them.
+        """
+        options = self.options.get(completed)
+        if options is not None:
+            return options
+        options, seen = [], set()
+        total = len(self.assignments)
+
+        def visit(today: Tuple[int, ...], remaining: Tuple[int, ...]) -> None:
+            done = completed.union(today)
+            if len(done) == total:
+                outcome = (tuple(sorted(today)), True)
+                if outcome not in seen:
+                    seen.add(outcome)
+                    options.append(outcome)
+                return
+            fits = False
+            for assignment in get_ready_assignments(done, self.assignments):
+                twin = self.predecessor.get(assignment.id)
+                if twin is not None and twin not in done:
+                    continue
+                can_fit, new_remaining, _ = can_fit_assignment(assignment, remaining)
+                if can_fit:
+                    fits = True
+                    visit(today + (assignment.id,), new_remaining)
+            if today:
+                outcome = (tuple(sorted(today)), not fits)
+                if outcome not in seen:
+                    seen.add(outcome)
+                    options.append(outcome)
+
+        visit((), tuple([self.K] * self.N))
+        self.options[completed] = options
+        self.computed += 1
+        return options
+
+    def solve(
+        self,
+        M: int,
+        packed_only: bool = False
+    ) -> List[Tuple[List[List[int]], bool]]:
+        """
+        All symmetry-reduced schedules within M days, like solve(expand=False).
+
+        Returns:
+            Unique (schedule, is_packed) tuples, days sorted
+        """
+        total = len(self.assignments)
+        solutions = []
+        # Frames: (completed, day, schedule so far, packed so far); completed
+        # is None for a finished schedule, reported when popped
+        stack = [(frozenset(), 1, (), True)]
+        while stack:
+            completed, day, schedule, is_packed = stack.pop()
+            if completed is None:
+                solutions.append(([list(d) for d in schedule], is_packed))
+                continue
+            children = []
+            for today, day_packed in self.day_options(completed):
+                done = completed.union(today)
+                if len(done) == total:
+                    children.append((None, day, schedule + (today,), is_packed))
+                elif day < M and (day_packed or not packed_only):
+                    children.append((done, day + 1, schedule + (today,),
+                                     is_packed and day_packed))
+            stack.extend(reversed(children))
+        # Different option paths can give the same days with the same flag
+        return remove_duplicate_schedules(solutions)
@@ -8,19 +8,52 @@ This is the main entry point that orchestrates the entire solution:
 4. Execute DFS solver
 5. Print all valid schedules
 
+With --fast, steps 3-5 are replaced by the greedy list scheduler in
+greedy.py, which prints ONE good schedule for very large inputs.
+With --top, steps 4-5 are replaced by the branch and bound in topk.py,
+which prints only the k best schedules under an objective.
+With --incremental, step 4 reuses the day-packing work saved by an earlier
+run on a slightly different input (incremental.py).
+
 Usage:
     python main.py <input-file> <number-of-days>
+    python main.py <input-file> <first>..<last>        (counts per day limit)
+    python main.py <input-file> [number-of-days] --fast [--priority cp|prompts]
+    python main.py <input-file> <number-of-days> --top <k> [--objective days|balance|packed]
+    python main.py <input-file> <number-of-days> --checkpoint <file>
+    python main.py <input-file> <number-of-days> --resume <file>
+    python main.py <input-file> <number-of-days> --profile[=cprofile]
+    python main.py <input-file> <number-of-days> --no-cache
+    python main.py <input-file> <number-of-days> --packed-only
+    python main.py <input-file> <number-of-days> --shard <i>/<n> [--shard-out FILE]
+    python main.py <input-file> <number-of-days> --merge <shard-file> ...
+    python main.py <input-file> <number-of-days> --incremental <state-file>
+    python main.py <input-file> <number-of-days> --dedup-memory <MB>
 
 Example:
     python main.py input1.txt 4
+    python main.py big_input.txt --fast
 
 Author: AAI Assignment 1
 """
 
 import sys
+import argparse
 from parser import parse_input, validate_dependencies
 from feasibility import check_feasibility, print_feasibility_report
-from solver import solve, print_all_solutions
+from solver import (solve, print_all_solutions, format_schedule, count_schedules,
+                    count_by_days, load_checkpoint, save_shard_result,
+                    merge_shard_results, CHECKPOINT_INTERVAL, DEDUP_MEMORY_LIMIT)
+from models import problem_fingerprint
+from graph import find_interchangeable_classes
+from greedy import greedy_schedule, capacity_lower_bound, PRIORITIES
+from topk import top_schedules, OBJECTIVES
+from incremental import IncrementalSolver
+from profiling import Profiler, PROFILE_MODES
+from cache import ResultCache, cache_key, source_digest
+
+# Modules whose code determines the enumeration result (part of the cache key)
+SOLVER_MODULES = ('solver', 'graph', 'models', 'feasibility', 'heuristics')
 
 
 def main():
@@ -29,53 +62,132 @@ def main():
     
     Command line interface:
         python main.py <input-filename> <number-of-days>
+        python main.py <input-filename> [number-of-days] --fast
     """
     # =========================================================================
     # Parse Command Line Arguments
     # =========================================================================
-    if len(sys.argv) != 3:
-        print("Usage: python main.py <input-filename> <number-of-days>")
-        print("Example: python main.py input1.txt 4")
-        sys.exit(1)
+    arg_parser = argparse.ArgumentParser(
+        description='Assignment 1: Find all valid schedules',
+        epilog='Example: python main.py input1.txt 4'
+    )
+    arg_parser.add_argument('input_file', help='Input file')
+    arg_parser.add_argument('days', nargs='?',
+                            help='Number of days M, or a range like 3..6 '
+                                 '(optional with --fast)')
+    arg_parser.add_argument('--fast', action='store_true',
+                            help='Build one schedule with the greedy list scheduler')
+    arg_parser.add_argument('--priority', choices=PRIORITIES, default='cp',
+                            help="--fast ordering: critical path ('cp') or prompt size")
+    arg_parser.add_argument('--packed-only', action='store_true',
+                            help='Find only the Packed schedules (never end a day early)')
+    arg_parser.add_argument('--top', type=int, metavar='K',
+                            help='Print only the K best schedules (branch and bound)')
+    arg_parser.add_argument('--objective', choices=OBJECTIVES, default='days',
+                            help="--top ranking: fewest days, lowest peak daily load "
+                                 "('balance') or fewest early-ended days ('packed')")
+    arg_parser.add_argument('--checkpoint', metavar='FILE',
+                            help='Periodically save search progress to FILE')
+    arg_parser.add_argument('--checkpoint-every', type=float, metavar='SECONDS',
+                            default=CHECKPOINT_INTERVAL,
+                            help=f'Seconds between checkpoints (default {CHECKPOINT_INTERVAL:g})')
+    arg_parser.add_argument('--resume', metavar='FILE',
+                            help='Continue a run from a checkpoint (keeps saving to FILE)')
+    arg_parser.add_argument('--profile', nargs='?', const='basic', choices=PROFILE_MODES,
+                            help='Report wall/CPU time and peak memory per phase; '
+                                 '--profile=cprofile also dumps pstats for the solver')
+    arg_parser.add_argument('--profile-out', metavar='FILE', default='solve.pstats',
+                            help='pstats file for --profile=cprofile (default solve.pstats)')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help='Do not read or write the persistent result cache')
+    arg_parser.add_argument('--shard', metavar='I/N',
+                            help='Search only shard I of N (1-based) and save it for --merge')
+    arg_parser.add_argument('--shard-out', metavar='FILE',
+                            help='Shard result file (default shard-I-of-N.json)')
+    arg_parser.add_argument('--merge', nargs='+', metavar='FILE',
+                            help='Combine --shard result files instead of searching')
+    arg_parser.add_argument('--dedup-memory', type=int, metavar='MB',
+                            default=DEDUP_MEMORY_LIMIT >> 20,
+                            help='Memory for duplicate removal before it spills to '
+                                 f'temporary files (default {DEDUP_MEMORY_LIMIT >> 20})')
+    arg_parser.add_argument('--incremental', metavar='FILE',
+                            help='Reuse and update the day-packing state saved in FILE')
+    args = arg_parser.parse_args()
+    profiler = Profiler(args.profile, args.profile_out)
     
-    input_filename = sys.argv[1]
+    input_filename = args.input_file
     
-    try:
-        M = int(sys.argv[2])
-        if M <= 0:
-            raise ValueError("Number of days must be positive")
-    except ValueError as e:
-        print(f"Error: Invalid number of days: {sys.argv[2]}")
-        print("Number of days must be a positive integer.")
-        sys.exit(1)
+    M = M_first = None
+    if args.days is None:
+        if not args.fast:
+            arg_parser.error('the number of days is required (unless --fast)')
+    else:
+        try:
+            M_first, M = parse_days(args.days)
+        except ValueError as e:
+            print(f"Error: Invalid number of days: {args.days}")
+            print("Number of days must be a positive integer or a range like 3..6.")
+            sys.exit(1)
+        if M_first != M and args.fast:
+            arg_parser.error('--fast takes a single number of days, not a range')
+    
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError:
+            arg_parser.error(f"--shard expects I/N with 1 <= I <= N, got '{args.shard}'")
+    if args.merge and (shard or args.resume or args.checkpoint or args.fast):
+        arg_parser.error('--merge cannot be combined with --shard, --checkpoint, --resume or --fast')
+    if args.incremental and (shard or args.merge or args.checkpoint or args.resume
+                             or args.fast or args.top is not None):
+        arg_parser.error('--incremental cannot be combined with --shard, --merge, '
+                         '--checkpoint, --resume, --fast or --top')
+    # Packed-only results are a different answer: keep their cache entries,
+    # checkpoints and shard files apart from full runs
+    variant = ('packed',) if args.packed_only else ()
+    if args.top is not None:
+        if args.top < 1:
+            arg_parser.error('--top must be at least 1')
+        if (M_first != M or args.fast or shard or args.merge or args.checkpoint
+                or args.resume or args.packed_only):
+            arg_parser.error('--top takes a single number of days and no --fast, --shard, '
+                             '--merge, --checkpoint, --resume or --packed-only '
+                             '(use --objective packed)')
     
     # =========================================================================
     # Parse Input File
     # =========================================================================
     print(f"\nReading input file: {input_filename}")
-    print(f"Target days (M): {M}")
+    if M is not None:
+        print(f"Target days (M): {M if M_first == M else f'{M_first}..{M}'}")
     
-    try:
-        N, K, assignments = parse_input(input_filename)
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_filename}' not found.")
-        sys.exit(1)
-    except ValueError as e:
-        print(f"Error parsing input file: {e}")
-        sys.exit(1)
+    with profiler.phase('parse'):
+        try:
+            N, K, assignments = parse_input(input_filename)
+        except FileNotFoundError:
+            print(f"Error: Input file '{input_filename}' not found.")
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error parsing input file: {e}")
+            sys.exit(1)
     
     # Validate that all dependencies reference existing assignments
-    try:
-        validate_dependencies(assignments)
-    except ValueError as e:
-        print(f"Error in dependency structure: {e}")
-        sys.exit(1)
+    with profiler.phase('validate'):
+        try:
+            validate_dependencies(assignments)
+        except ValueError as e:
+            print(f"Error in dependency structure: {e}")
+            sys.exit(1)
     
     print(f"\nParsed successfully:")
     print(f"  - Students (N): {N}")
     print(f"  - Prompts/day (K): {K}")
     print(f"  - Assignments: {len(assignments)}")
     
+    if args.fast:
+        return run_fast(assignments, N, K, M, args.priority, profiler)
+    
     # Print assignment details
     print("\nAssignments:")
     for aid in sorted(assignments.keys()):
@@ -87,12 +199,17 @@ def main():
     # Feasibility Checks
     # =========================================================================
     print("\n")
-    is_feasible = print_feasibility_report(assignments, N, K, M)
+    with profiler.phase('feasibility'):
+        is_feasible = print_feasibility_report(assignments, N, K, M)
     
     if not is_feasible:
         print("\nExiting due to infeasibility.")
         sys.exit(1)
     
+    if args.top is not None:
+        return run_top(assignments, N, K, M, args.top, args.objective,
+                       not args.no_cache, profiler)
+    
     # =========================================================================
     # Run Solver
     # =========================================================================
@@ -100,18 +217,250 @@ def main():
     print("RUNNING DFS SOLVER")
     print("=" * 60)
     
-    solutions = solve(assignments, N, K, M)
+    resume = None
+    checkpoint_path = args.checkpoint
+    if args.resume:
+        try:
+            resume = load_checkpoint(args.resume)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot resume from '{args.resume}': {e}")
+            sys.exit(1)
+        checkpoint_path = checkpoint_path or args.resume
+        print(f"Resuming from checkpoint: {args.resume} "
+              f"({len(resume['stack'])} open frames, "
+              f"{len(resume['solutions'])} schedules so far)")
+    
+    # Interchangeable assignments are searched once per arrangement; the
+    # reduced schedules are expanded lazily while printing
+    classes = find_interchangeable_classes(assignments)
+    if classes:
+        print("Interchangeable assignments: " + ", ".join(
+            "{" + ", ".join(f"A{aid}" for aid in members) + "}" for members in classes))
+    
+    with profiler.phase('solve'):
+        # Identical problem + M + solver code → answer straight from disk
+        cache = ResultCache(enabled=not args.no_cache and not args.merge)
+        key = cache_key(assignments, 'enumerate', N, K, M, source_digest(SOLVER_MODULES),
+                        *(('shard',) + shard if shard else ()), *variant)
+        cached = cache.get(key)
+        
+        if args.merge:
+            try:
+                solutions, missing, n = merge_shard_results(
+                    args.merge, problem_fingerprint(assignments, N, K, M, *variant))
+            except (OSError, ValueError) as e:
+                print(f"Error: Cannot merge shards: {e}")
+                sys.exit(1)
+            print(f"Merged {len(args.merge)} shard file(s) of {n}")
+            if missing:
+                print("WARNING: shard(s) " + ", ".join(f"{i}/{n}" for i in missing)
+                      + " missing - the result below is incomplete")
+        elif cached is not None:
+            solutions = [(schedule, is_packed) for schedule, is_packed in cached]
+            print(f"Loaded {sum(count_schedules(solutions, classes))} schedule(s) "
+                  f"from the result cache")
+        elif args.incremental:
+            solutions = run_incremental(assignments, N, K, M, args.packed_only,
+                                        args.incremental)
+            cache.put(key, [[schedule, is_packed] for schedule, is_packed in solutions])
+        else:
+            try:
+                solutions = solve(assignments, N, K, M,
+                                  checkpoint_path=checkpoint_path,
+                                  checkpoint_interval=args.checkpoint_every,
+                                  resume=resume,
+                                  profiler=profiler,
+                                  expand=False,
+                                  shard=shard,
+                                  packed_only=args.packed_only,
+                                  dedup_memory=args.dedup_memory << 20)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            cache.put(key, [[schedule, is_packed] for schedule, is_packed in solutions])
     
     # =========================================================================
     # Print Results
     # =========================================================================
-    print_all_solutions(solutions)
+    if shard:
+        # A shard is only part of the answer: save it for --merge
+        out_path = args.shard_out or f"shard-{shard[0]}-of-{shard[1]}.json"
+        try:
+            save_shard_result(out_path, problem_fingerprint(assignments, N, K, M, *variant),
+                              shard, solutions)
+        except OSError as e:
+            print(f"Error: Cannot write shard result '{out_path}': {e}")
+            sys.exit(1)
+        packed, relaxed = count_schedules(solutions, classes)
+        print(f"\nShard {shard[0]}/{shard[1]}: {packed + relaxed} schedule(s) "
+              f"({packed} packed, {relaxed} relaxed) written to {out_path}")
+        profiler.report()
+        return 0
     
-    if solutions:
-        print(f"\nTotal valid schedules: {len(solutions)}")
-    else:
-        print("\nNo valid schedules exist within the given constraints.")
+    if M_first != M:
+        # One search with the largest M answers the whole range
+        with profiler.phase('print'):
+            print_range_summary(solutions, classes, M_first, M)
+        profiler.report()
+        return 0
+    
+    with profiler.phase('print'):
+        print_all_solutions(solutions, classes)
+        
+        if solutions:
+            print(f"\nTotal valid schedules: {sum(count_schedules(solutions, classes))}")
+        else:
+            print("\nNo valid schedules exist within the given constraints.")
+    
+    profiler.report()
+    return 0
+
+
+def parse_days(text):
+    """
+    Parse the days argument: 'M' or a range 'first..last'.
+    
+    Returns:
+        (first, last); equal for a single M
+    
+    Raises:
+        ValueError: If a bound is not a positive integer or first > last
+    """
+    first, sep, last = text.partition('..')
+    first, last = int(first), int(last if sep else first)
+    if first <= 0 or last < first:
+        raise ValueError(f"Invalid number of days: {text}")
+    return first, last
+
+
+def parse_shard(text):
+    """
+    Parse --shard 'I/N'.
+    
+    Returns:
+        (I, N)
+    
+    Raises:
+        ValueError: Unless 1 <= I <= N
+    """
+    index, _, count = text.partition('/')
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard: {text}")
+    return index, count
+
+
+def print_range_summary(solutions, classes, M_first, M_last):
+    """Print schedule counts (and Packed/Relaxed split) for each M in the range."""
+    by_days = count_by_days(solutions, classes)
+    print("\n" + "=" * 60)
+    print(f"SCHEDULES BY DAY LIMIT (M = {M_first}..{M_last})")
+    print("=" * 60)
+    print(f"{'M':>4}{'Schedules':>12}{'Packed':>10}{'Relaxed':>10}{'New':>10}")
+    packed = relaxed = 0
+    for M in range(1, M_last + 1):
+        new_packed, new_relaxed = by_days.get(M, (0, 0))
+        packed, relaxed = packed + new_packed, relaxed + new_relaxed
+        if M >= M_first:
+            print(f"{M:>4}{packed + relaxed:>12}{packed:>10}{relaxed:>10}"
+                  f"{new_packed + new_relaxed:>10}")
+    print("\nNew: schedules that use exactly M days")
+
+
+def run_top(assignments, N, K, M, k, objective, use_cache, profiler):
+    """
+    Find and print the k best schedules under an objective.
+    
+    Uses the branch and bound in topk.py instead of enumerating every
+    schedule; answers are cached like full enumerations.
+    """
+    print("\n" + "=" * 60)
+    print(f"RUNNING BRANCH AND BOUND (top {k} by {objective})")
+    print("=" * 60)
+    
+    stats = {}
+    with profiler.phase('solve'):
+        cache = ResultCache(enabled=use_cache)
+        key = cache_key(assignments, 'top', N, K, M, k, objective,
+                        source_digest(SOLVER_MODULES + ('topk',)))
+        best = cache.get(key)
+        if best is None:
+            best = top_schedules(assignments, N, K, M, k, objective, stats)
+            cache.put(key, [[schedule, is_packed, value] for schedule, is_packed, value in best])
+            print(f"Search nodes: {stats['nodes']} ({stats['pruned']} pruned by the bound)")
+        else:
+            print(f"Loaded {len(best)} schedule(s) from the result cache")
+    
+    with profiler.phase('print'):
+        if not best:
+            print("\nNo valid schedules exist within the given constraints.")
+        else:
+            print(f"\nBest {len(best)} schedule(s) by {objective}:")
+            print("=" * 50)
+            for i, (schedule, is_packed, value) in enumerate(best, 1):
+                label = "Packed" if is_packed else "Relaxed"
+                print(f"\nSchedule {i} ({label}, {objective}: {value}):")
+                print("-" * 30)
+                print(format_schedule(schedule))
+            print("\n" + "=" * 50)
+    
+    profiler.report()
+    return 0
+
+
+def run_incremental(assignments, N, K, M, packed_only, state_path):
+    """
+    Enumerate with IncrementalSolver, reusing and then updating a state file.
+    
+    Returns:
+        The symmetry-reduced (schedule, is_packed) tuples, as solve(expand=False)
+    """
+    inc = IncrementalSolver(assignments, N, K)
+    try:
+        inc.load(state_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load incremental state '{state_path}': {e}")
+        sys.exit(1)
+    if inc.changed:
+        print("Changed since the saved state: " + ", ".join(f"A{aid}" for aid in inc.changed))
+    solutions = inc.solve(M, packed_only)
+    print(f"Day options: {inc.reused} reused from {state_path}, {inc.computed} computed")
+    try:
+        inc.save(state_path)
+    except OSError as e:
+        print(f"Warning: Cannot save incremental state '{state_path}': {e}")
+    return solutions
+
+
+def run_fast(assignments, N, K, M, priority, profiler):
+    """
+    Build and print one schedule with the greedy list scheduler.
+    
+    Skips the exhaustive search entirely; reports how far the schedule is
+    from the capacity lower bound and, if M was given, whether it meets M.
+    """
+    print("\n" + "=" * 60)
+    print(f"RUNNING GREEDY LIST SCHEDULER (priority: {priority})")
+    print("=" * 60)
+    
+    with profiler.phase('solve'):
+        try:
+            schedule = greedy_schedule(assignments, N, K, priority)
+        except ValueError as e:
+            print(f"\nError: {e}")
+            return 1
+    
+    lower_bound = capacity_lower_bound(assignments, N, K)
+    
+    print()
+    print(format_schedule(schedule))
+    print(f"\nDays used: {len(schedule)}")
+    print(f"Capacity lower bound: {lower_bound} (gap: {len(schedule) - lower_bound})")
+    if M is not None:
+        verdict = "meets" if len(schedule) <= M else "exceeds"
+        print(f"Schedule {verdict} the target of M={M} days")
     
+    profiler.report()
     return 0
 
 
@@ -4,12 +4,14 @@ models.py - Data Classes for Assignment Scheduler
 This module defines the core data structures used throughout the application:
 - Assignment: Represents a single assignment with its properties
 - State: Represents the current state during DFS search
+- problem_fingerprint: Stable hash identifying a problem instance
 
 Author: AAI Assignment 1
 """
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Set, Tuple, List
+from typing import Dict, Set, Tuple, List
 
 
 @dataclass(frozen=True)
@@ -99,3 +101,25 @@ def create_initial_state(N: int, K: int) -> State:
         completed=frozenset(),
         student_remaining=tuple([K] * N)
     )
+
+
+def problem_fingerprint(assignments: Dict[int, Assignment], *params) -> str:
+    """
+    Hash a problem instance into a stable hex string.
+    
+    The assignments are normalized (sorted by ID, dependencies sorted), so
+    the same problem always hashes the same regardless of input file layout,
+    comments or line order. Any extra parameters (N, K, M, ...) are mixed in.
+    
+    Args:
+        assignments: Dictionary of all assignments
+        *params: Additional values that identify the query (e.g. N, K, M)
+    
+    Returns:
+        SHA-256 hex digest
+    """
+    normalized = [
+        (a.id, a.prompt_count, sorted(a.dependencies))
+        for a in sorted(assignments.values(), key=lambda a: a.id)
+    ]
+    return hashlib.sha256(repr((normalized, params)).encode('utf-8')).hexdigest()
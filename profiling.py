@@ -0,0 +1,124 @@
+"""
+profiling.py - Per-Phase Timing and Memory Report
+
+This module lets the drivers (main.py, assg02.py, assg03.py) measure where a
+run spends its time and memory, phase by phase:
+- Wall time (time.perf_counter)
+- CPU time (time.process_time)
+- Peak traced memory (tracemalloc) while the phase was running
+
+Phases may nest (e.g. 'dedup' inside 'solve'); a nested phase's peak also
+counts towards its parents. In 'cprofile' mode one chosen phase additionally
+runs under cProfile and its stats are dumped to a pstats file, readable with:
+    python -m pstats <file>
+
+A disabled Profiler (mode=None) costs nothing: phase() just yields.
+
+Author: AAI Assignment 1
+"""
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import List, Optional
+
+PROFILE_MODES = ('basic', 'cprofile')
+
+
+class Profiler:
+    """
+    Collects (phase, wall, cpu, peak memory) records.
+
+    Attributes:
+        mode: None (disabled), 'basic' or 'cprofile'
+        pstats_path: Where the cProfile stats are dumped
+        cprofile_phase: Name of the phase run under cProfile (may be changed
+                        between phases to profile several, each to its own file)
+        records: List of (depth, name, wall_s, cpu_s, peak_bytes) in order
+                 of phase START, so nested phases follow their parent
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        pstats_path: str = 'solve.pstats',
+        cprofile_phase: str = 'solve'
+    ):
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}', expected one of {PROFILE_MODES}")
+        self.mode = mode
+        self.pstats_path = pstats_path
+        self.cprofile_phase = cprofile_phase
+        self.records: List[list] = []
+        self.dumped: List[str] = []
+        self._active: List[list] = []
+        if mode and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measure the enclosed block as one phase."""
+        if not self.enabled:
+            yield
+            return
+
+        # Credit the peak so far to the enclosing phases, then start fresh
+        self._bump_peaks()
+        tracemalloc.reset_peak()
+
+        record = [len(self._active), name, 0.0, 0.0, 0]
+        self.records.append(record)
+        self._active.append(record)
+
+        profile = None
+        if self.mode == 'cprofile' and name == self.cprofile_phase:
+            profile = cProfile.Profile()
+
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            record[2] = time.perf_counter() - start_wall
+            record[3] = time.process_time() - start_cpu
+            self._bump_peaks()
+            self._active.pop()
+            if profile:
+                profile.dump_stats(self.pstats_path)
+                self.dumped.append(f"'{name}' -> {self.pstats_path}")
+
+    def _bump_peaks(self) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        for record in self._active:
+            record[4] = max(record[4], peak)
+
+    def report(self) -> None:
+        """Print the per-phase table (no-op when disabled)."""
+        if not self.enabled:
+            return
+        print("\n" + "=" * 60)
+        print("PROFILE")
+        print("=" * 60)
+        print(f"{'Phase':<24}{'Wall (s)':>10}{'CPU (s)':>10}{'Peak mem':>14}")
+        for depth, name, wall, cpu, peak in self.records:
+            label = '  ' * depth + name
+            print(f"{label:<24}{wall:>10.4f}{cpu:>10.4f}{format_bytes(peak):>14}")
+        for dumped in self.dumped:
+            print(f"\ncProfile stats written: {dumped}")
+
+
+def format_bytes(size: int) -> str:
+    """Human-readable byte count, e.g. 1536 -> '1.5 KB'."""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -12,15 +12,48 @@ Algorithm Overview:
 
 Key Concepts:
 - Bin-packing: Fitting assignments into student capacities each day
-- State pruning: Stop exploring if we exceed M days
+- State pruning: Stop exploring if we exceed M days, or once some open
+  assignment's earliest/latest day window (feasibility.DayWindows) is empty
 - Backtracking: Undo moves to explore alternative paths
+- Explicit stack: The DFS keeps its own stack of frames (no recursion limit),
+  which can be checkpointed to disk and resumed later
+- Path as cons cells: a frame's day so far and schedule so far are linked
+  (item, rest) pairs shared with its parent, so extending the path is O(1);
+  lists are built only for a finished schedule
+- Symmetry reduction: interchangeable assignments (same prompts, same
+  dependencies, same dependents) are only picked in ID order; the search
+  finds one schedule per class arrangement and expand_schedules() relabels
+  it back into every concrete schedule
+- Sharding: the first SHARD_DEPTH days of a schedule pick one of n shards,
+  so n independent runs (solve(..., shard=(i, n))) cover disjoint subtrees
+- External dedup: above a memory limit, duplicate removal sorts compact
+  schedule keys in runs spilled to temporary files and merges them
 
 Author: AAI Assignment 1
 """
 
-from typing import Dict, List, Tuple, Set
-from models import Assignment, State, create_initial_state
-from graph import get_ready_assignments
+import hashlib
+import heapq
+import json
+import os
+import struct
+import tempfile
+import time
+from itertools import combinations
+from math import factorial
+from typing import Dict, Iterator, List, Optional, Tuple, Set
+from models import Assignment, problem_fingerprint
+from graph import (get_ready_assignments, find_interchangeable_classes,
+                   symmetry_predecessors)
+from feasibility import DayWindows
+from profiling import Profiler
+
+CHECKPOINT_VERSION = 2  # 2: frames and schedules are symmetry-reduced
+CHECKPOINT_INTERVAL = 300.0  # Seconds between checkpoints
+SHARD_DEPTH = 2              # Days of the schedule prefix that choose a shard
+SHARD_VERSION = 1
+DEDUP_MEMORY_LIMIT = 512 << 20  # Estimated bytes of in-memory dedup keys before spilling
+MERGE_FAN_IN = 64               # Spilled runs merged at once
 
 
 def can_fit_assignment(
@@ -57,24 +90,60 @@ def solve(
     assignments: Dict[int, Assignment],
     N: int,
     K: int,
-    M: int
-) -> List[List[List[int]]]:
+    M: int,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: float = CHECKPOINT_INTERVAL,
+    resume: Optional[dict] = None,
+    profiler: Optional[Profiler] = None,
+    stats: Optional[dict] = None,
+    expand: bool = True,
+    shard: Optional[Tuple[int, int]] = None,
+    packed_only: bool = False,
+    dedup_memory: int = DEDUP_MEMORY_LIMIT
+) -> List[Tuple[List[List[int]], bool]]:
     """
     Find all valid schedules using DFS with backtracking.
     
     A schedule is represented as a list of days, where each day contains
     a list of assignment IDs completed that day.
     
+    The DFS runs on an explicit stack of compact frames instead of Python
+    recursion, so deep instances cannot hit RecursionError. When
+    checkpoint_path is given, the frontier (remaining stack) and the unique
+    schedules found so far are written there every checkpoint_interval
+    seconds and once more at the end; pass the loaded checkpoint back as
+    `resume` to continue where a killed run stopped.
+    
     Args:
         assignments: Dictionary of all assignments
         N: Number of students
         K: Prompts per student per day
         M: Maximum number of days allowed
+        checkpoint_path: File to write checkpoints to (None = never)
+        checkpoint_interval: Seconds between checkpoints
+        resume: Checkpoint dict from load_checkpoint() to continue from
+        profiler: Optional Profiler; the search and dedup are timed as
+                  nested 'search' and 'dedup' phases
+        stats: Optional dict; receives 'nodes' (DFS frames expanded)
+        expand: False returns the symmetry-reduced schedules only (one per
+                arrangement of interchangeable classes); pass them through
+                expand_schedules() / count_schedules() for the full set
+        shard: (i, n) to search only the subtrees whose first SHARD_DEPTH
+               days hash to shard i of n (1-based); the n shards are
+               disjoint and together give exactly the unsharded result
+        packed_only: True to find the Packed schedules only; a day is never
+                     ended while a ready assignment still fits, so the
+                     Relaxed subtrees are not explored at all
+        dedup_memory: Estimated bytes the duplicate check may keep in
+                      memory; beyond that it spills to temporary files
     
     Returns:
-        List of valid schedules. Each schedule is:
+        List of (schedule, is_packed) tuples. Each schedule is:
         [[day1_assignments], [day2_assignments], ...]
     
+    Raises:
+        ValueError: If `resume` was written for a different problem
+    
     Example:
         [[1, 7], [2, 5], [4, 6, 3], [8]]
         Means: Day 1: A1, A7; Day 2: A2, A5; Day 3: A4, A6, A3; Day 4: A8
@@ -83,133 +152,419 @@ def solve(
     # is_packed = True if no day was ended early (always exhausted capacity or finished)
     all_solutions: List[Tuple[List[List[int]], bool]] = []
     total_assignments = len(assignments)
+    fingerprint = problem_fingerprint(assignments, N, K, M, *(shard or ()),
+                                      *(('packed',) if packed_only else ()))
+    profiler = profiler or Profiler()
+    classes = find_interchangeable_classes(assignments)
+    predecessor = symmetry_predecessors(classes)
+    windows = DayWindows(assignments, N * K, M)
     
-    def dfs(
-        day: int,
-        completed: frozenset,
-        student_remaining: Tuple[int, ...],
-        current_day_assignments: List[int],
-        schedule: List[List[int]],
-        is_packed: bool  # Track if all days so far were fully packed
-    ):
-        """
-        Recursive DFS function to explore all valid schedules.
-        
-        Args:
-            day: Current day number (1-indexed)
-            completed: Set of completed assignment IDs
-            student_remaining: Remaining prompts for each student today
-            current_day_assignments: Assignments done so far today
-            schedule: Schedule built so far (list of completed days)
-            is_packed: True if no early day-advances occurred so far
-        """
-        # =====================================================================
-        # Goal Check: All assignments completed?
-        # =====================================================================
-        if len(completed) == total_assignments:
-            # Build final schedule including current day's work
-            final_schedule = schedule.copy()
-            if current_day_assignments:
-                final_schedule.append(current_day_assignments.copy())
-            all_solutions.append((final_schedule, is_packed))
-            return
-        
-        # =====================================================================
-        # Pruning: Exceeded day limit?
-        # =====================================================================
-        if day > M:
-            return  # Not a valid solution
+    # =========================================================================
+    # Frames: (day, completed, student_remaining, today, schedule, is_packed)
+    # =========================================================================
+    # today and schedule are cons cells (newest first, None = empty):
+    # today = (aid, earlier today), schedule = (day cell, earlier days). A
+    # frame extends its parent's path with one 2-tuple instead of copying
+    # it. Children are pushed in reverse order so they are popped in
+    # exactly the order the recursive version visited them.
+    if resume is not None:
+        if resume['fingerprint'] != fingerprint:
+            raise ValueError(
+                "Checkpoint was written for a different input, N, K or M"
+            )
+        stack = [_decode_frame(frame) for frame in resume['stack']]
+        all_solutions = [(schedule, is_packed)
+                         for schedule, is_packed in resume['solutions']]
+    else:
+        stack = [(1, frozenset(), tuple([K] * N), None, None, True)]
+    
+    next_checkpoint = time.monotonic() + checkpoint_interval
+    nodes = 0
+    
+    with profiler.phase('search'):
+        while stack:
+            day, completed, student_remaining, today, schedule, is_packed = stack.pop()
         
-        # =====================================================================
-        # Find Ready Assignments
-        # =====================================================================
-        ready = get_ready_assignments(completed, assignments)
+            # =================================================================
+            # Periodic checkpoint of the frontier (cheap clock check)
+            # =================================================================
+            nodes += 1
+            if checkpoint_path and nodes % 1024 == 0 and time.monotonic() >= next_checkpoint:
+                stack.append((day, completed, student_remaining, today, schedule, is_packed))
+                all_solutions = remove_duplicate_schedules(all_solutions, dedup_memory)
+                save_checkpoint(checkpoint_path, fingerprint, stack, all_solutions)
+                stack.pop()
+                next_checkpoint = time.monotonic() + checkpoint_interval
         
-        # =====================================================================
-        # Try Each Ready Assignment
-        # =====================================================================
-        made_a_move = False
+            # =================================================================
+            # Goal Check: All assignments completed?
+            # =================================================================
+            if len(completed) == total_assignments:
+                # Build final schedule including current day's work
+                final_schedule = _path_days((today, schedule) if today else schedule)
+                if shard is None or shard_of(final_schedule, shard[1]) == shard[0]:
+                    all_solutions.append((final_schedule, is_packed))
+                continue
         
-        for assignment in ready:
-            can_fit, new_remaining, _ = can_fit_assignment(
-                assignment, student_remaining
-            )
+            # =================================================================
+            # Pruning: Exceeded day limit?
+            # =================================================================
+            if day > M:
+                continue  # Not a valid solution
             
-            if can_fit:
-                made_a_move = True
-                
-                # Make the move
-                new_completed = completed | {assignment.id}
-                new_day_assignments = current_day_assignments + [assignment.id]
-                
-                # Recurse: continue on the same day with reduced capacity
-                dfs(
-                    day,
-                    new_completed,
-                    new_remaining,
-                    new_day_assignments,
-                    schedule,
-                    is_packed  # Carry forward packed status
+            # A chain can no longer fit between today and M: dead branch
+            # (checked as each day starts; the windows are memoized per set)
+            if not today and not windows.is_open(completed, day):
+                continue
+        
+            # =================================================================
+            # Try Each Ready Assignment (same day, reduced capacity)
+            # =================================================================
+            ready = get_ready_assignments(completed, assignments)
+            children = []
+            for assignment in ready:
+                # Interchangeable twins only in ID order (its twin is ready too)
+                twin = predecessor.get(assignment.id)
+                if twin is not None and twin not in completed:
+                    continue
+                can_fit, new_remaining, _ = can_fit_assignment(
+                    assignment, student_remaining
                 )
+                if can_fit:
+                    children.append((
+                        day,
+                        completed | {assignment.id},
+                        new_remaining,
+                        (assignment.id, today),
+                        schedule,
+                        is_packed  # Carry forward packed status
+                    ))
         
-        # =====================================================================
-        # Try Advancing to Next Day
-        # =====================================================================
-        # We can advance to the next day if:
-        # 1. We did some work today (current_day_assignments not empty), OR
-        # 2. We couldn't make any moves (forced to wait)
-        if current_day_assignments:
-            # Check if this is an early advance (relaxed) or forced advance (packed)
-            # It's packed only if NO ready assignment could fit any student
-            ready_after_work = get_ready_assignments(completed, assignments)
-            could_do_more = False
-            for a in ready_after_work:
-                can_fit_more, _, _ = can_fit_assignment(a, student_remaining)
-                if can_fit_more:
-                    could_do_more = True
-                    break
-            
-            # If we're advancing but could do more, this path becomes "relaxed"
-            new_is_packed = is_packed and (not could_do_more)
-            
-            # Finish current day, start fresh tomorrow
-            new_schedule = schedule + [current_day_assignments.copy()]
-            new_remaining = tuple([K] * N)  # Reset all students
-            
-            dfs(
-                day + 1,
-                completed,
-                new_remaining,
-                [],
-                new_schedule,
-                new_is_packed
-            )
-        elif not made_a_move and len(completed) < total_assignments:
-            # Stuck: no ready assignments fit, but we haven't done anything today
-            # This can happen if all ready assignments need more prompts than
-            # any student has remaining, but we haven't done anything yet
-            # This is actually a dead end (shouldn't happen if feasibility passed)
-            pass
-    
-    # Start DFS from initial state
-    initial_remaining = tuple([K] * N)
-    dfs(
-        day=1,
-        completed=frozenset(),
-        student_remaining=initial_remaining,
-        current_day_assignments=[],
-        schedule=[],
-        is_packed=True  # Start assuming packed until proven otherwise
-    )
+            # =================================================================
+            # Try Advancing to Next Day
+            # =================================================================
+            # Only after doing some work today. It's packed only if NO ready
+            # assignment could still fit a student (children is non-empty
+            # exactly when something could), otherwise this path becomes "relaxed"
+            # With sharding, the subtree below the first SHARD_DEPTH days
+            # belongs to exactly one shard; the others skip it here.
+            # packed_only never ends a day early, so never goes Relaxed
+            advance = today and not (packed_only and children)
+            if advance and (shard is None or day != SHARD_DEPTH or
+                            shard_of(_path_days((today, schedule)), shard[1]) == shard[0]):
+                stack.append((
+                    day + 1,
+                    completed,
+                    tuple([K] * N),  # Reset all students
+                    None,
+                    (today, schedule),
+                    is_packed and not children
+                ))
+        
+            stack.extend(reversed(children))
+    
+    
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + nodes
     
     # Remove duplicate schedules (same day groupings, different order within day)
-    unique_solutions = remove_duplicate_schedules(all_solutions)
+    with profiler.phase('dedup'):
+        unique_solutions = remove_duplicate_schedules(all_solutions, dedup_memory)
+    
+    if checkpoint_path:
+        # Final checkpoint: empty frontier, so resuming just reports results
+        save_checkpoint(checkpoint_path, fingerprint, [], unique_solutions)
     
+    if expand and classes:
+        return list(expand_schedules(unique_solutions, classes))
     return unique_solutions
 
 
+def expand_schedules(
+    solutions: List[Tuple[List[List[int]], bool]],
+    classes: List[List[int]]
+) -> Iterator[Tuple[List[List[int]], bool]]:
+    """
+    Lazily relabel symmetry-reduced schedules into every concrete schedule.
+    
+    In a reduced schedule the members of a class appear in ID order across
+    the days; each distinct way of handing the members out to those same
+    day slots is a different valid schedule with the same Packed/Relaxed
+    status. The reduced schedule itself comes first.
+    
+    Args:
+        solutions: Reduced (schedule, is_packed) tuples from solve(expand=False)
+        classes: find_interchangeable_classes() of the same problem
+    
+    Yields:
+        Concrete (schedule, is_packed) tuples, days sorted
+    """
+    for schedule, is_packed in solutions:
+        if not classes:
+            yield schedule, is_packed
+            continue
+        day_of = {aid: d for d, day in enumerate(schedule) for aid in day}
+        per_class = [list(_spread(members, _slot_counts(members, day_of)))
+                     for members in classes]
+        for choice in _product(per_class):
+            days = [[aid for aid in day if aid not in choice] for day in schedule]
+            for aid, d in choice.items():
+                days[d].append(aid)
+            yield [sorted(day) for day in days], is_packed
+
+
+def count_schedules(
+    solutions: List[Tuple[List[List[int]], bool]],
+    classes: List[List[int]]
+) -> Tuple[int, int]:
+    """
+    Count (packed, relaxed) concrete schedules without expanding them.
+    
+    A class of k members spread as c1, c2, ... over its days can be handed
+    out in k! / (c1! c2! ...) ways; classes multiply.
+    """
+    packed = relaxed = 0
+    for schedule, is_packed in solutions:
+        day_of = {aid: d for d, day in enumerate(schedule) for aid in day}
+        ways = 1
+        for members in classes:
+            ways *= factorial(len(members))
+            for _, c in _slot_counts(members, day_of):
+                ways //= factorial(c)
+        if is_packed:
+            packed += ways
+        else:
+            relaxed += ways
+    return packed, relaxed
+
+
+def count_by_days(
+    solutions: List[Tuple[List[List[int]], bool]],
+    classes: List[List[int]]
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Count (packed, relaxed) concrete schedules by the number of days used.
+    
+    Every schedule found for a day limit M is also valid for any larger M
+    (with the same Packed/Relaxed status), so one search with the largest
+    limit answers every smaller one: the count for M is the sum over
+    days used <= M.
+    
+    Returns:
+        Dictionary mapping days used to (packed, relaxed)
+    """
+    by_days: Dict[int, Tuple[int, int]] = {}
+    for schedule, is_packed in solutions:
+        packed, relaxed = count_schedules([(schedule, is_packed)], classes)
+        p, r = by_days.get(len(schedule), (0, 0))
+        by_days[len(schedule)] = (p + packed, r + relaxed)
+    return by_days
+
+
+def _slot_counts(members: List[int], day_of: Dict[int, int]) -> List[Tuple[int, int]]:
+    """[(day index, members on that day), ...] in day order."""
+    counts: Dict[int, int] = {}
+    for aid in members:
+        counts[day_of[aid]] = counts.get(day_of[aid], 0) + 1
+    return sorted(counts.items())
+
+
+def _spread(members: List[int], counts: List[Tuple[int, int]]) -> Iterator[Dict[int, int]]:
+    """Every way to put `members` on the day slots: {aid: day index}."""
+    if not counts:
+        yield {}
+        return
+    (day, c), rest = counts[0], counts[1:]
+    for chosen in combinations(members, c):
+        others = [aid for aid in members if aid not in chosen]
+        for tail in _spread(others, rest):
+            tail.update((aid, day) for aid in chosen)
+            yield tail
+
+
+def _product(options: List[List[Dict[int, int]]]) -> Iterator[Dict[int, int]]:
+    """Merge one mapping from each list, in every combination."""
+    if not options:
+        yield {}
+        return
+    for head in options[0]:
+        for tail in _product(options[1:]):
+            yield {**head, **tail}
+
+
+def shard_of(days, n: int) -> int:
+    """
+    Shard (1..n) owning every schedule that starts with these days.
+    
+    Only the first SHARD_DEPTH days count, each as a sorted set, and the
+    hash is SHA-256, so every machine and Python version agrees.
+    """
+    prefix = [sorted(day) for day in days[:SHARD_DEPTH]]
+    digest = hashlib.sha256(json.dumps(prefix).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % n + 1
+
+
+def save_shard_result(
+    path: str,
+    fingerprint: str,
+    shard: Tuple[int, int],
+    solutions: List[Tuple[List[List[int]], bool]]
+) -> None:
+    """
+    Atomically write one shard's (symmetry-reduced) schedules as JSON.
+    
+    Args:
+        path: Output file
+        fingerprint: problem_fingerprint(assignments, N, K, M), unsharded
+        shard: (i, n)
+        solutions: Unique reduced (schedule, is_packed) tuples of the shard
+    """
+    data = {
+        'version': SHARD_VERSION,
+        'fingerprint': fingerprint,
+        'shard': list(shard),
+        'solutions': [[schedule, is_packed] for schedule, is_packed in solutions],
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def merge_shard_results(
+    paths: List[str],
+    fingerprint: str
+) -> Tuple[List[Tuple[List[List[int]], bool]], List[int], int]:
+    """
+    Combine shard files written by save_shard_result() for one problem.
+    
+    Args:
+        paths: Shard files (any order)
+        fingerprint: problem_fingerprint(assignments, N, K, M) they must match
+    
+    Returns:
+        (unique solutions, missing shard numbers, n)
+    
+    Raises:
+        ValueError: If a file is not a shard result, belongs to another
+                    problem / M, or the files disagree on n
+    """
+    solutions: List[Tuple[List[List[int]], bool]] = []
+    seen_shards: Set[int] = set()
+    total_shards = None
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}: corrupt shard file: {e}")
+        if not isinstance(data, dict) or data.get('version') != SHARD_VERSION:
+            raise ValueError(f"{path}: not a shard result (or written by another version)")
+        if data['fingerprint'] != fingerprint:
+            raise ValueError(f"{path}: written for a different input, N, K or M")
+        i, n = data['shard']
+        if total_shards is not None and n != total_shards:
+            raise ValueError(f"{path}: shard {i}/{n} does not match the other files (/{total_shards})")
+        total_shards = n
+        seen_shards.add(i)
+        solutions.extend((schedule, is_packed) for schedule, is_packed in data['solutions'])
+    missing = [i for i in range(1, (total_shards or 0) + 1) if i not in seen_shards]
+    return remove_duplicate_schedules(solutions), missing, total_shards or 0
+
+
+def save_checkpoint(
+    path: str,
+    fingerprint: str,
+    stack: list,
+    solutions: List[Tuple[List[List[int]], bool]]
+) -> None:
+    """
+    Atomically write the search frontier and partial results as JSON.
+    
+    The file is written next to `path` and renamed over it, so a run killed
+    mid-write leaves the previous checkpoint intact.
+    
+    Args:
+        path: Checkpoint file
+        fingerprint: problem_fingerprint() of the problem being solved
+        stack: Remaining DFS frames (bottom of stack first)
+        solutions: Unique (schedule, is_packed) tuples found so far
+    """
+    data = {
+        'version': CHECKPOINT_VERSION,
+        'fingerprint': fingerprint,
+        'stack': [_encode_frame(frame) for frame in stack],
+        'solutions': [[schedule, is_packed] for schedule, is_packed in solutions],
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> dict:
+    """
+    Read a checkpoint written by save_checkpoint().
+    
+    Args:
+        path: Checkpoint file
+    
+    Returns:
+        Checkpoint dict, suitable for solve(..., resume=...)
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is not a checkpoint of this version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Corrupt checkpoint file: {e}")
+    if not isinstance(data, dict) or data.get('version') != CHECKPOINT_VERSION:
+        raise ValueError("Not a checkpoint file (or written by another version)")
+    return data
+
+
+def _encode_frame(frame: tuple) -> list:
+    """DFS frame → JSON-friendly list."""
+    day, completed, student_remaining, today, schedule, is_packed = frame
+    return [day, sorted(completed), list(student_remaining), _unwind(today),
+            _path_days(schedule), is_packed]
+
+
+def _decode_frame(data: list) -> tuple:
+    """Inverse of _encode_frame()."""
+    day, completed, student_remaining, today, schedule, is_packed = data
+    return (day, frozenset(completed), tuple(student_remaining), _cons(today),
+            _cons([_cons(d) for d in schedule]), is_packed)
+
+
+def _cons(items: list):
+    """Cons list (newest first) of items pushed in list order."""
+    cell = None
+    for item in items:
+        cell = (item, cell)
+    return cell
+
+
+def _unwind(cell) -> list:
+    """Items of a cons list in the order they were pushed."""
+    items = []
+    while cell is not None:
+        item, cell = cell
+        items.append(item)
+    return items[::-1]  # Exact-size copy: solutions are kept until dedup
+
+
+def _path_days(schedule) -> List[List[int]]:
+    """Cons list of day cells → [[day 1 IDs], [day 2 IDs], ...]."""
+    return [_unwind(day) for day in _unwind(schedule)]
+
+
 def remove_duplicate_schedules(
-    schedules: List[Tuple[List[List[int]], bool]]
+    schedules: List[Tuple[List[List[int]], bool]],
+    memory_limit: int = DEDUP_MEMORY_LIMIT
 ) -> List[Tuple[List[List[int]], bool]]:
     """
     Remove duplicate schedules that differ only in order within a day.
@@ -217,12 +572,20 @@ def remove_duplicate_schedules(
     Since students are equivalent, [A1, A7] on day 1 is the same as [A7, A1].
     We normalize by sorting assignments within each day.
     
+    When the set of normalized schedules would exceed memory_limit bytes
+    (estimated), the check runs on disk instead (_dedup_on_disk); the
+    result is the same, in the same order.
+    
     Args:
         schedules: List of schedules (may contain duplicates)
+        memory_limit: Estimated bytes the in-memory check may use
     
     Returns:
         List of unique schedules
     """
+    if schedules and len(schedules) * _key_bytes(schedules[0][0]) > memory_limit:
+        return _dedup_on_disk(schedules, memory_limit)
+    
     seen = set()
     unique = []
     
@@ -239,6 +602,99 @@ def remove_duplicate_schedules(
     return unique
 
 
+def _key_bytes(schedule: List[List[int]]) -> int:
+    """Approximate memory of one normalized key in the `seen` set."""
+    # Set slot + (normalized, is_packed) + outer tuple + one tuple per day
+    return 120 + 48 * len(schedule) + 8 * sum(len(day) for day in schedule)
+
+
+def _dedup_on_disk(
+    schedules: List[Tuple[List[List[int]], bool]],
+    memory_limit: int
+) -> List[Tuple[List[List[int]], bool]]:
+    """
+    remove_duplicate_schedules() with the keys sorted on disk.
+    
+    Every schedule becomes a compact key (Packed flag, then each sorted day
+    as varints) paired with its position. Runs of about memory_limit bytes
+    are sorted and spilled to temporary files, then merged: the first
+    position of each distinct key is marked as kept. Only one byte per
+    schedule stays in memory, and the first occurrences come out in their
+    original order, exactly as the in-memory version keeps them.
+    """
+    keep = bytearray(len(schedules))
+    with tempfile.TemporaryDirectory(prefix='dedup-') as spill_dir:
+        runs: List[str] = []
+        buffer: List[Tuple[bytes, int]] = []
+        size = 0
+        for index, (schedule, is_packed) in enumerate(schedules):
+            key = _schedule_key(schedule, is_packed)
+            buffer.append((key, index))
+            size += len(key) + 100  # key object + tuple + list slot
+            if size >= memory_limit:
+                runs.append(_write_run(spill_dir, len(runs), sorted(buffer)))
+                buffer, size = [], 0
+        if buffer:
+            runs.append(_write_run(spill_dir, len(runs), sorted(buffer)))
+        
+        # Merge passes keep the number of open files bounded
+        while len(runs) > MERGE_FAN_IN:
+            merged = []
+            for start in range(0, len(runs), MERGE_FAN_IN):
+                group = runs[start:start + MERGE_FAN_IN]
+                merged.append(_write_run(spill_dir, len(runs) + len(merged),
+                                         heapq.merge(*map(_read_run, group))))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+        
+        # (key, position) order: the first record of each key is its first occurrence
+        previous = None
+        for key, index in heapq.merge(*map(_read_run, runs)):
+            if key != previous:
+                keep[index] = 1
+                previous = key
+    
+    return [([sorted(day) for day in schedule], is_packed)
+            for (schedule, is_packed), kept in zip(schedules, keep) if kept]
+
+
+def _schedule_key(schedule: List[List[int]], is_packed: bool) -> bytes:
+    """Packed flag + each day (sorted) as a varint length and varint IDs."""
+    out = bytearray([is_packed])
+    for day in schedule:
+        for value in [len(day)] + sorted(day):
+            while value >= 0x80:
+                out.append(value & 0x7F | 0x80)
+                value >>= 7
+            out.append(value)
+    return bytes(out)
+
+
+_RUN_RECORD = struct.Struct('<IQ')  # key length, schedule position
+
+
+def _write_run(spill_dir: str, number: int, records) -> str:
+    """Write sorted (key, position) records to a new run file."""
+    path = os.path.join(spill_dir, f'run-{number}.bin')
+    with open(path, 'wb') as f:
+        for key, index in records:
+            f.write(_RUN_RECORD.pack(len(key), index))
+            f.write(key)
+    return path
+
+
+def _read_run(path: str) -> Iterator[Tuple[bytes, int]]:
+    """Stream the (key, position) records of a run file."""
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(_RUN_RECORD.size)
+            if not header:
+                return
+            length, index = _RUN_RECORD.unpack(header)
+            yield f.read(length), index
+
+
 def format_schedule(schedule: List[List[int]]) -> str:
     """
     Format a schedule for printing.
@@ -256,27 +712,31 @@ def format_schedule(schedule: List[List[int]]) -> str:
     return '\n'.join(lines)
 
 
-def print_all_solutions(solutions: List[Tuple[List[List[int]], bool]]) -> None:
+def print_all_solutions(
+    solutions: List[Tuple[List[List[int]], bool]],
+    classes: Optional[List[List[int]]] = None
+) -> None:
     """
     Print all solutions in a readable format.
     
     Args:
         solutions: List of (schedule, is_packed) tuples
+        classes: Interchangeable classes if `solutions` are symmetry-reduced
+                 (solve(expand=False)); they are expanded while printing
     """
     if not solutions:
         print("No valid schedules found.")
         return
     
     # Count packed vs relaxed
-    packed_count = sum(1 for _, is_packed in solutions if is_packed)
-    relaxed_count = len(solutions) - packed_count
+    packed_count, relaxed_count = count_schedules(solutions, classes or [])
     
-    print(f"\nFound {len(solutions)} valid schedule(s):")
+    print(f"\nFound {packed_count + relaxed_count} valid schedule(s):")
     print(f"  - Packed: {packed_count} (days fully utilized)")
     print(f"  - Relaxed: {relaxed_count} (advanced day early)\n")
     print("=" * 50)
     
-    for i, (schedule, is_packed) in enumerate(solutions, 1):
+    for i, (schedule, is_packed) in enumerate(expand_schedules(solutions, classes or []), 1):
         label = "Packed" if is_packed else "Relaxed"
         print(f"\nSchedule {i} ({label}):")
         print("-" * 30)
@@ -0,0 +1,22 @@
+from assg02 import greedy_days, find_min_days, find_min_prompts
+
+# A2 depends on A9, which is not in the input.
+DANGLING = {1: {'prompts': 2, 'deps': frozenset()},
+            2: {'prompts': 3, 'deps': frozenset({9})}}
+
+
+def test_greedy_days_dangling_dependency():
+    assert greedy_days(DANGLING, 2, 5, 1) == -1
+    assert greedy_days(DANGLING, 2, 5, 2) == -1
+
+
+def test_find_min_days_dangling_dependency():
+    for mode in (1, 2):
+        assert find_min_days(DANGLING, 2, 5, mode, order='prompts') == -1
+
+
+def test_find_min_prompts_dangling_dependency():
+    for order in ('cp', 'unlocks'):
+        for mode in (1, 2):
+            assert find_min_prompts(DANGLING, 2, 3, mode, order=order) == -1
+            assert find_min_days(DANGLING, 2, 5, mode, order=order) == -1
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from assg03 import find_cost, find_days, parse_input, race
+
+INPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'input01.txt')
+
+
+def test_race_reports_the_engine_that_found_the_optimum():
+    asgn = parse_input(INPUT)
+    expected = find_cost(asgn, 2, 'A', 7, 1, 1, 'dfs')
+    winner, r, nodes, scheme, times = race(asgn, 2, 'A', 'cost', 7, 1, 1)
+    assert (r, scheme) == (expected[0], expected[2])
+    assert nodes > 0
+    assert winner in times
+
+
+def test_race_matches_sequential_astar_where_dfbb_is_not_optimal():
+    # DFBB's first schedule here takes 4 days; the optimum is 3
+    prompts, deps = {1: 4, 2: 3, 3: 1, 4: 2, 5: 3, 6: 2}, {4: {1}, 6: {1}}
+    asgn = {a: {'prompts': p, 'deps': frozenset(deps.get(a, ()))} for a, p in prompts.items()}
+    assert find_days(asgn, 3, 'A', 7, 1, 1, len(asgn), 'dfbb')[0] == 4
+    expected = find_days(asgn, 3, 'A', 7, 1, 1, len(asgn), 'astar')
+    for _ in range(5):
+        winner, r, nodes, scheme, times = race(asgn, 3, 'A', 'days', 7, 1, 1)
+        assert (r, scheme) == (expected[0], expected[2])
+
+
+def test_race_raises_when_every_engine_fails():
+    asgn = parse_input(INPUT)
+    with pytest.raises(RuntimeError, match='every engine failed'):
+        race(asgn, 'x', 'A', 'cost', 7, 1, 1)
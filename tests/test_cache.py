@@ -0,0 +1,53 @@
+import os
+import sys
+import types
+
+import cache
+from cache import ResultCache
+
+
+def test_put_skips_entries_over_the_cap(tmp_path):
+    rc = ResultCache(str(tmp_path), max_bytes=10_000, max_entry_bytes=100)
+    rc.put('aa01', list(range(10)))
+    rc.put('aa02', list(range(1000)))
+    assert rc.get('aa01') == list(range(10))
+    assert rc.get('aa02') is None
+    assert not [n for _, _, files in os.walk(tmp_path) for n in files if n.endswith('.tmp')]
+
+
+def test_put_keeps_a_running_total_without_walking(tmp_path, monkeypatch):
+    rc = ResultCache(str(tmp_path), max_bytes=10_000)
+    rc.put('aa00', [0])
+    walks = []
+    real_walk = os.walk
+    monkeypatch.setattr(cache.os, 'walk', lambda *a: walks.append(a) or real_walk(*a))
+    for i in range(1, 20):
+        rc.put(f'aa{i:02d}', [i])
+    rc.put('aa05', [5, 5, 5])  # overwrite
+    assert walks == []
+    assert rc._read_total() == rc._scan()[1]
+
+
+def test_eviction_trims_below_the_limit(tmp_path):
+    rc = ResultCache(str(tmp_path), max_bytes=2000, max_entry_bytes=500)
+    for i in range(40):
+        rc.put(f'{i:04x}', ['x' * 90])
+    entries, total = rc._scan()
+    assert total <= 2000
+    assert rc._read_total() == total
+    assert rc.get(f'{39:04x}') == ['x' * 90]
+
+
+def test_source_digest_follows_local_imports(tmp_path, monkeypatch):
+    (tmp_path / 'entry.py').write_text('import os\nfrom helper import f\n')
+    (tmp_path / 'helper.py').write_text('def f():\n    return 1\n')
+    monkeypatch.setattr(cache, 'SOURCE_DIR', str(tmp_path))
+    monkeypatch.setitem(sys.modules, 'entry', types.SimpleNamespace(__file__=str(tmp_path / 'entry.py')))
+    before = cache.source_digest(['entry'])
+    (tmp_path / 'helper.py').write_text('def f():\n    return 2\n')
+    assert cache.source_digest(['entry']) != before
+
+
+def test_solver_digest_covers_heuristics():
+    import feasibility  # noqa: F401  (imports heuristics)
+    assert 'heuristics' in cache.local_imports(sys.modules['feasibility'].__file__)
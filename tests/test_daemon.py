@@ -0,0 +1,31 @@
+from daemon import SchedulerDaemon
+
+
+def make_daemon(**kwargs):
+    daemon = SchedulerDaemon(workers=1, **kwargs)
+    daemon.pool.shutdown()
+    return daemon
+
+
+def test_memo_evicts_lru_by_bytes():
+    daemon = make_daemon(memo_bytes=1600)
+    for i in range(20):
+        daemon.remember(i, {'schedules': ['x' * 80]})
+    assert daemon.memo_used <= 1600
+    assert daemon.memo_used == sum(size for _, size in daemon.memo.values())
+    assert 19 in daemon.memo and 0 not in daemon.memo
+
+
+def test_memo_skips_results_over_the_entry_cap():
+    daemon = make_daemon(memo_bytes=1600)
+    daemon.remember('small', {'count': 1})
+    daemon.remember('huge', {'schedules': ['x' * 200]})
+    assert 'huge' not in daemon.memo and 'small' in daemon.memo
+
+
+def test_memo_replaces_an_entry_without_double_counting():
+    daemon = make_daemon(memo_bytes=1600)
+    daemon.remember('k', {'count': 1})
+    daemon.remember('k', {'count': 2})
+    assert len(daemon.memo) == 1
+    assert daemon.memo_used == daemon.memo['k'][1]
@@ -0,0 +1,104 @@
+import math
+import random
+from itertools import combinations
+
+import pytest
+
+from assg03 import expand_B, get_ready, llm_type
+from heuristics import DayBound, bin_packing_bound
+
+
+def random_instance(rng, size):
+    asgn = {}
+    for aid in range(1, size + 1):
+        deps = frozenset(d for d in range(1, aid) if rng.random() < 0.3)
+        asgn[aid] = {'prompts': rng.randint(1, 4), 'deps': deps}
+    g = max((asgn[a]['prompts'] for a in asgn if llm_type(a) == 'chatgpt'), default=1)
+    h = max((asgn[a]['prompts'] for a in asgn if llm_type(a) == 'gemini'), default=1)
+    return asgn, rng.randint(1, 3), g + rng.randint(0, 3), h + rng.randint(0, 3)
+
+
+def successors(asgn, N, g, h, case):
+    """Every one-day step from a completed set, without symmetry reduction."""
+    if case == 'B':
+        return lambda done: [nd for nd in expand_B(asgn, N, done, g, h, {}) if nd != done]
+    def succ(done):
+        ready, out = get_ready(done, asgn), []
+        for sz in range(1, min(N, len(ready)) + 1):
+            for combo in combinations(ready, sz):
+                gn = sum(asgn[a]['prompts'] for a in combo if llm_type(a) == 'chatgpt')
+                mn = sum(asgn[a]['prompts'] for a in combo if llm_type(a) == 'gemini')
+                if gn <= g and mn <= h:
+                    out.append(done | frozenset(combo))
+        return out
+    return succ
+
+
+def exact_days(asgn, succ):
+    """Exact remaining days for every completed set reachable from the start."""
+    exact = {}
+    def remaining(done):
+        if done not in exact:
+            if len(done) == len(asgn):
+                exact[done] = 0
+            else:
+                exact[done] = 1 + min((remaining(nd) for nd in succ(done)), default=math.inf)
+        return exact[done]
+    remaining(frozenset())
+    return exact
+
+
+@pytest.mark.parametrize('case', ['A', 'B'])
+def test_day_bound_is_admissible(case):
+    rng = random.Random(case)
+    for _ in range(80):
+        asgn, N, g, h = random_instance(rng, rng.randint(2, 7))
+        hd, succ = DayBound(asgn, N, g, h, case), successors(asgn, N, g, h, case)
+        for done, days in exact_days(asgn, succ).items():
+            assert hd(done) <= days, (asgn, N, g, h, sorted(done))
+
+
+def test_day_bound_case_a_is_consistent():
+    # astar_A never reopens a completed set, so f = day + hd must not decrease
+    rng = random.Random(7)
+    for _ in range(80):
+        asgn, N, g, h = random_instance(rng, rng.randint(2, 7))
+        hd, succ = DayBound(asgn, N, g, h, 'A'), successors(asgn, N, g, h, 'A')
+        for done in exact_days(asgn, succ):
+            for nd in succ(done):
+                assert hd(done) <= 1 + hd(nd), (asgn, N, g, h, sorted(done), sorted(nd))
+
+
+def exact_bins(sizes, capacity):
+    best = [len(sizes)]
+    def place(i, bins):
+        if len(bins) >= best[0]:
+            return
+        if i == len(sizes):
+            best[0] = len(bins)
+            return
+        for b in range(len(bins)):
+            if bins[b] + sizes[i] <= capacity:
+                bins[b] += sizes[i]
+                place(i + 1, bins)
+                bins[b] -= sizes[i]
+        place(i + 1, bins + [sizes[i]])
+    place(0, [])
+    return best[0]
+
+
+def test_bin_packing_bound_against_exact():
+    rng = random.Random(3)
+    for _ in range(300):
+        capacity = rng.randint(2, 12)
+        sizes = [rng.randint(1, capacity) for _ in range(rng.randint(0, 8))]
+        sizes.sort(reverse=True)
+        assert bin_packing_bound(sizes, capacity) <= exact_bins(sizes, capacity), (sizes, capacity)
+
+
+def test_bin_packing_bound_known_values():
+    assert bin_packing_bound([], 5) == 0
+    assert bin_packing_bound([6], 5) == math.inf
+    # three items just over half the capacity need a bin each; volume says 2
+    assert bin_packing_bound([6, 6, 6], 10) == 3
+    assert bin_packing_bound([3, 3, 3, 3], 6) == 2
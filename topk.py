@@ -0,0 +1,200 @@
+"""
+topk.py - Best Schedules by an Objective
+
+This module finds the k best valid schedules (within M days) under an
+objective, without enumerating every schedule and sorting afterwards.
+
+Objectives (smaller is better):
+- 'days':    days used
+- 'balance': prompts done on the busiest day (peak daily load)
+- 'packed':  days ended early while a ready assignment still fit
+             (0 = a Packed schedule, see solver.print_all_solutions)
+
+Algorithm Overview:
+1. Depth-first branch and bound over exactly the states of solver.solve
+   (same transitions, same symmetry reduction of interchangeable assignments)
+2. The k best distinct schedules found so far are kept in a heap; the worst
+   of them is the incumbent
+3. Every state gets an admissible lower bound on the objective of any
+   schedule below it; once k schedules are known, states whose bound is no
+   better than the incumbent are skipped
+4. When the stack is empty the heap holds k optimal schedules. Ties are
+   resolved by search order (the DFS fills each day first)
+
+Bounds (never overestimate):
+- All objectives: the prompts left over after today's remaining capacity
+  need ceil(left / (N*K)) more days; past M the state is dropped, as it is
+  when an open assignment's day window (feasibility.DayWindows) is empty
+- 'days':    today plus those extra days
+- 'balance': the busiest day so far, the largest remaining assignment, and
+             the average load of days day..M
+- 'packed':  the early-ended days so far (the count never decreases)
+
+Author: AAI Assignment 1
+"""
+
+import heapq
+from math import ceil
+from typing import Dict, List, Optional, Tuple
+from models import Assignment
+from graph import (get_ready_assignments, find_interchangeable_classes,
+                   symmetry_predecessors)
+from feasibility import DayWindows
+from solver import can_fit_assignment, expand_schedules
+
+OBJECTIVES = ('days', 'balance', 'packed')
+
+
+def top_schedules(
+    assignments: Dict[int, Assignment],
+    N: int,
+    K: int,
+    M: int,
+    k: int,
+    objective: str = 'days',
+    stats: Optional[dict] = None
+) -> List[Tuple[List[List[int]], bool, int]]:
+    """
+    Find the k best schedules under an objective by branch and bound.
+
+    Args:
+        assignments: Dictionary of all assignments
+        N: Number of students
+        K: Prompts per student per day
+        M: Maximum number of days allowed
+        k: Number of schedules wanted
+        objective: One of OBJECTIVES
+        stats: Optional dict; receives 'nodes' (states expanded) and
+               'pruned' (states cut by the bound)
+
+    Returns:
+        Up to k (schedule, is_packed, value) tuples, best first; fewer only
+        if fewer valid schedules exist
+
+    Raises:
+        ValueError: If the objective is unknown or k < 1
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}', expected one of {OBJECTIVES}")
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+
+    total_assignments = len(assignments)
+    total_prompts = sum(a.prompt_count for a in assignments.values())
+    day_capacity = N * K
+    classes = find_interchangeable_classes(assignments)
+    predecessor = symmetry_predecessors(classes)
+    windows = DayWindows(assignments, day_capacity, M)
+
+    # Heap of the best schedules: (-value, -seq, key, schedule, is_packed),
+    # so heap[0] is the incumbent (worst value, latest found among equals)
+    best: List[tuple] = []
+    kept: Dict[tuple, int] = {}
+    seq = 0
+    nodes = pruned = 0
+
+    def value_of(schedule: List[List[int]], relaxed: int) -> int:
+        if objective == 'days':
+            return len(schedule)
+        if objective == 'balance':
+            return max(sum(assignments[aid].prompt_count for aid in day) for day in schedule)
+        return relaxed
+
+    # =========================================================================
+    # Frames: (day, completed, student_remaining, today, schedule,
+    #          relaxed days, busiest finished day, prompts done so far)
+    # =========================================================================
+    stack = [(1, frozenset(), tuple([K] * N), (), (), 0, 0, 0)]
+
+    while stack:
+        frame = stack.pop()
+        day, completed, student_remaining, today, schedule, relaxed, peak, done = frame
+        nodes += 1
+
+        # =====================================================================
+        # Goal: expand the reduced schedule into its concrete schedules
+        # =====================================================================
+        if len(completed) == total_assignments:
+            final_schedule = [sorted(d) for d in schedule]
+            if today:
+                final_schedule.append(sorted(today))
+            value = value_of(final_schedule, relaxed)
+            for concrete, is_packed in expand_schedules([(final_schedule, relaxed == 0)], classes):
+                # Distinct as in remove_duplicate_schedules: day sets + Packed
+                key = (tuple(tuple(d) for d in concrete), is_packed)
+                if kept.get(key, value + 1) <= value or (len(best) == k and value >= -best[0][0]):
+                    continue
+                if key in kept:  # Found again with a better value ('packed')
+                    best = [item for item in best if item[2] != key]
+                    heapq.heapify(best)
+                seq += 1
+                heapq.heappush(best, (-value, -seq, key, concrete, is_packed))
+                kept[key] = value
+                if len(best) > k:
+                    del kept[heapq.heappop(best)[2]]
+            continue
+
+        # =====================================================================
+        # Bound: prune states that cannot finish in M days or beat the incumbent
+        # =====================================================================
+        today_load = day_capacity - sum(student_remaining)
+        left = total_prompts - done
+        extra_days = ceil(max(0, left - sum(student_remaining)) / day_capacity)
+        if day + extra_days > M or not (today or windows.is_open(completed, day)):
+            continue
+        if objective == 'days':
+            bound = day + extra_days
+        elif objective == 'balance':
+            biggest = max(a.prompt_count for aid, a in assignments.items()
+                          if aid not in completed)
+            bound = max(peak, today_load, biggest,
+                        ceil((today_load + left) / (M - day + 1)))
+        else:
+            bound = relaxed
+        if len(best) == k and bound >= -best[0][0]:
+            pruned += 1
+            continue
+
+        # =====================================================================
+        # Children: same transitions as solver.solve
+        # =====================================================================
+        ready = get_ready_assignments(completed, assignments)
+        children = []
+        for assignment in ready:
+            twin = predecessor.get(assignment.id)
+            if twin is not None and twin not in completed:
+                continue
+            can_fit, new_remaining, _ = can_fit_assignment(assignment, student_remaining)
+            if can_fit:
+                children.append((
+                    day,
+                    completed | {assignment.id},
+                    new_remaining,
+                    today + (assignment.id,),
+                    schedule,
+                    relaxed,
+                    peak,
+                    done + assignment.prompt_count
+                ))
+
+        if today:
+            stack.append((
+                day + 1,
+                completed,
+                tuple([K] * N),
+                (),
+                schedule + (today,),
+                relaxed + bool(children),  # Ended early if something still fit
+                max(peak, today_load),
+                done
+            ))
+
+        stack.extend(reversed(children))
+
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + nodes
+        stats['pruned'] = stats.get('pruned', 0) + pruned
+
+    ranked = sorted(best, key=lambda item: (-item[0], -item[1]))
+    return [(schedule, is_packed, -neg_value)
+            for neg_value, _, _, schedule, is_packed in ranked]
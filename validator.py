@@ -0,0 +1,357 @@
+"""
+validator.py - Bulk Schedule Validator
+
+Checks schedules produced elsewhere (other tools, shard runs, old outputs)
+against an input file without re-running the search. The problem is
+compiled once; every schedule is then checked in O(V + E):
+
+1. Every assignment appears exactly once, and only known IDs appear
+2. At most M days are used
+3. Dependencies: each assignment's dependency bitmask must be covered by
+   the assignments done on earlier days or the same day (results are
+   shared at once, as in solver.py)
+4. Capacity: each day's prompt counts must pack into N students of K
+   prompts (one student per assignment). First-Fit-Decreasing and the L2
+   bound settle almost every day; the rest get an exact search. Verdicts
+   are memoized per multiset of prompt counts, which repeat constantly.
+
+Every schedule solver.solve finds passes. The capacity check is exact, so a
+rare day that packs only in an order First-Fit never tries is accepted
+here even though solve does not list it.
+
+Input formats (one schedule = list of days, a day = list of IDs):
+- text:   main.py output; "Day d: A1, A2" lines, a new schedule starts at a
+          "Schedule ..." header or at "Day 1:"
+- jsonl:  one JSON value per line: [[1, 2], [3]], [schedule, is_packed]
+          (daemon 'enumerate' rows) or {"schedule": [[1, 2], [3]]}
+- binary: unsigned LEB128 varints, per schedule: day count, then for each
+          day its size followed by the IDs (see write_binary)
+
+Usage:
+    python validator.py <input-file> <days> <schedules-file> [--format text|jsonl|binary]
+    python validator.py <input-file> <days> - --format jsonl < schedules.jsonl
+    python validator.py <input-file> <days> <schedules-file> --to-binary out.bin
+
+Author: AAI Assignment 1
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO
+from models import Assignment
+from parser import parse_input, validate_dependencies
+from heuristics import bin_packing_bound
+
+FORMATS = ('text', 'jsonl', 'binary')
+MAX_ERRORS = 10  # Invalid schedules reported in detail by default
+
+DAY_LINE = re.compile(r'^\s*Day\s+(\d+)\s*:\s*(.*)$')
+
+
+class ScheduleValidator:
+    """
+    A problem compiled for fast, repeated schedule checks.
+
+    Attributes:
+        index: Assignment ID → bit position
+        prompts: Assignment ID → prompt count
+        dep_mask: Assignment ID → bitmask of its dependencies
+        full_mask: Bitmask with every assignment set
+        checked: Schedules checked so far
+    """
+
+    def __init__(self, assignments: Dict[int, Assignment], N: int, K: int, M: int):
+        self.N, self.K, self.M = N, K, M
+        self.index = {aid: bit for bit, aid in enumerate(sorted(assignments))}
+        self.prompts = {aid: a.prompt_count for aid, a in assignments.items()}
+        self.dep_mask = {}
+        for aid, a in assignments.items():
+            mask = 0
+            for dep_id in a.dependencies:
+                mask |= 1 << self.index[dep_id]
+            self.dep_mask[aid] = mask
+        self.full_mask = (1 << len(assignments)) - 1
+        self.checked = 0
+        self._packable: Dict[tuple, bool] = {}
+
+    def check(self, schedule: List[List[int]]) -> Optional[str]:
+        """
+        Validate one schedule.
+
+        Returns:
+            None if the schedule is valid, otherwise the first problem found
+        """
+        self.checked += 1
+        if len(schedule) > self.M:
+            return f"uses {len(schedule)} days, but M={self.M}"
+        done = 0
+        for day_num, day in enumerate(schedule, 1):
+            today = 0
+            for aid in day:
+                bit = self.index.get(aid)
+                if bit is None:
+                    return f"day {day_num}: unknown assignment A{aid}"
+                if (done | today) >> bit & 1:
+                    return f"day {day_num}: A{aid} is scheduled twice"
+                today |= 1 << bit
+            available = done | today
+            for aid in day:
+                missing = self.dep_mask[aid] & ~available
+                if missing:
+                    return (f"day {day_num}: A{aid} needs "
+                            f"{', '.join(self._names(missing))} first")
+            if not self.packable(sorted((self.prompts[aid] for aid in day), reverse=True)):
+                return (f"day {day_num}: prompts {sorted(self.prompts[aid] for aid in day)} "
+                        f"do not fit {self.N} student(s) x K={self.K}")
+            done = available
+        if done != self.full_mask:
+            return f"missing {', '.join(self._names(self.full_mask & ~done))}"
+        return None
+
+    def packable(self, sizes: List[int]) -> bool:
+        """Whether `sizes` (sorted largest first) fit into N bins of capacity K."""
+        key = tuple(sizes)
+        verdict = self._packable.get(key)
+        if verdict is None:
+            verdict = self._packable[key] = self._pack(sizes)
+        return verdict
+
+    def _pack(self, sizes: List[int]) -> bool:
+        if not sizes:
+            return True
+        if sizes[0] > self.K or sum(sizes) > self.N * self.K:
+            return False
+        # First-Fit-Decreasing success proves it, L2 failure refutes it
+        bins: List[int] = []
+        for s in sizes:
+            for i, used in enumerate(bins):
+                if used + s <= self.K:
+                    bins[i] += s
+                    break
+            else:
+                bins.append(s)
+        if len(bins) <= self.N:
+            return True
+        if bin_packing_bound(sizes, self.K) > self.N:
+            return False
+        # Exact: place the largest items first; equal bin loads are tried once
+        loads = [0] * self.N
+
+        def place(i: int) -> bool:
+            if i == len(sizes):
+                return True
+            tried = set()
+            for b in range(self.N):
+                if loads[b] + sizes[i] <= self.K and loads[b] not in tried:
+                    tried.add(loads[b])
+                    loads[b] += sizes[i]
+                    if place(i + 1):
+                        return True
+                    loads[b] -= sizes[i]
+            return False
+        return place(0)
+
+    def _names(self, mask: int) -> List[str]:
+        return [f"A{aid}" for aid, bit in sorted(self.index.items()) if mask >> bit & 1]
+
+
+# =============================================================================
+# Readers and writer
+# =============================================================================
+
+def read_text(stream: TextIO) -> Iterator[List[List[int]]]:
+    """Schedules from main.py-style text ("Day d: A1, A2" lines)."""
+    schedule: List[List[int]] = []
+    for line in stream:
+        match = DAY_LINE.match(line)
+        if match is None:
+            if line.lstrip().startswith('Schedule') and schedule:
+                yield schedule
+                schedule = []
+            continue
+        if int(match.group(1)) == 1 and schedule:
+            yield schedule
+            schedule = []
+        items = [item.strip() for item in match.group(2).split(',') if item.strip()]
+        schedule.append([int(item.lstrip('Aa')) for item in items])
+    if schedule:
+        yield schedule
+
+
+def read_jsonl(stream: TextIO) -> Iterator[List[List[int]]]:
+    """Schedules from JSON lines (bare, [schedule, is_packed] or {"schedule": ...})."""
+    for line in stream:
+        if not line.strip():
+            continue
+        value = json.loads(line)
+        if isinstance(value, dict):
+            if 'schedule' not in value:
+                raise ValueError(f"JSON object without 'schedule': {line.strip()[:60]}")
+            value = value['schedule']
+        elif len(value) == 2 and isinstance(value[1], bool):
+            value = value[0]
+        yield value
+
+
+def read_binary(stream: BinaryIO) -> Iterator[List[List[int]]]:
+    """Schedules from the varint encoding written by write_binary()."""
+    data = stream.read()
+    pos = 0
+
+    def varint() -> int:
+        nonlocal pos
+        value = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    try:
+        while pos < len(data):
+            days = varint()
+            yield [[varint() for _ in range(varint())] for _ in range(days)]
+    except IndexError:
+        raise ValueError(f"truncated binary schedule at byte {pos}")
+
+
+def write_binary(schedules: Iterable[List[List[int]]], stream: BinaryIO) -> int:
+    """Encode schedules for read_binary(); returns how many were written."""
+    count = 0
+    for schedule in schedules:
+        out = bytearray()
+        for value in _flatten(schedule):
+            while value >= 0x80:
+                out.append(value & 0x7F | 0x80)
+                value >>= 7
+            out.append(value)
+        stream.write(out)
+        count += 1
+    return count
+
+
+def _flatten(schedule: List[List[int]]) -> Iterator[int]:
+    yield len(schedule)
+    for day in schedule:
+        yield len(day)
+        yield from day
+
+
+def open_schedules(path: str, fmt: Optional[str] = None) -> Iterator[List[List[int]]]:
+    """
+    Stream schedules from a file ('-' = stdin).
+
+    The format defaults to the extension: .jsonl / .json → jsonl, .bin →
+    binary, anything else → text.
+    """
+    if fmt is None:
+        fmt = ('jsonl' if path.endswith(('.jsonl', '.json')) else
+               'binary' if path.endswith('.bin') else 'text')
+    if fmt == 'binary':
+        if path == '-':
+            yield from read_binary(sys.stdin.buffer)
+        else:
+            with open(path, 'rb') as f:
+                yield from read_binary(f)
+        return
+    reader = read_jsonl if fmt == 'jsonl' else read_text
+    if path == '-':
+        yield from reader(sys.stdin)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from reader(f)
+
+
+def validate_all(
+    validator: ScheduleValidator,
+    schedules: Iterable[List[List[int]]],
+    max_errors: int = MAX_ERRORS
+) -> dict:
+    """
+    Check a stream of schedules.
+
+    Returns:
+        {'checked', 'valid', 'invalid', 'errors': [(schedule number, reason)],
+         'seconds', 'per_second'}; only the first max_errors are listed
+    """
+    start = time.perf_counter()
+    checked = invalid = 0
+    errors = []
+    for number, schedule in enumerate(schedules, 1):
+        checked += 1
+        try:
+            reason = validator.check(schedule)
+        except (TypeError, ValueError) as e:
+            reason = f"malformed schedule: {e}"
+        if reason is not None:
+            invalid += 1
+            if len(errors) < max_errors:
+                errors.append((number, reason))
+    seconds = time.perf_counter() - start
+    return {
+        'checked': checked,
+        'valid': checked - invalid,
+        'invalid': invalid,
+        'errors': errors,
+        'seconds': seconds,
+        'per_second': checked / seconds if seconds > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description='Validate schedules against an input file')
+    arg_parser.add_argument('input_file', help='Problem input file (N, K, assignments)')
+    arg_parser.add_argument('days', type=int, help='Number of days M')
+    arg_parser.add_argument('schedules', help="Schedules file, '-' for stdin")
+    arg_parser.add_argument('--format', choices=FORMATS,
+                            help='Schedules format (default: by extension, else text)')
+    arg_parser.add_argument('--max-errors', type=int, default=MAX_ERRORS,
+                            help=f'Invalid schedules to list (default {MAX_ERRORS})')
+    arg_parser.add_argument('--to-binary', metavar='FILE',
+                            help='Convert the schedules to the binary format instead')
+    args = arg_parser.parse_args()
+
+    try:
+        N, K, assignments = parse_input(args.input_file)
+        validate_dependencies(assignments)
+    except FileNotFoundError:
+        print(f"Error: Input file '{args.input_file}' not found.")
+        return 1
+    except ValueError as e:
+        print(f"Error in input file: {e}")
+        return 1
+
+    schedules = open_schedules(args.schedules, args.format)
+    try:
+        if args.to_binary:
+            with open(args.to_binary, 'wb') as f:
+                count = write_binary(schedules, f)
+            print(f"Wrote {count} schedule(s) to {args.to_binary}")
+            return 0
+        summary = validate_all(ScheduleValidator(assignments, N, K, args.days),
+                               schedules, args.max_errors)
+    except FileNotFoundError:
+        print(f"Error: Schedules file '{args.schedules}' not found.")
+        return 1
+    except ValueError as e:  # Unreadable JSON line or truncated binary
+        print(f"Error reading schedules: {e}")
+        return 1
+
+    for number, reason in summary['errors']:
+        print(f"Schedule {number}: INVALID - {reason}")
+    if summary['invalid'] > len(summary['errors']):
+        print(f"... and {summary['invalid'] - len(summary['errors'])} more invalid")
+    print(f"\nChecked {summary['checked']} schedule(s): {summary['valid']} valid, "
+          f"{summary['invalid']} invalid")
+    print(f"Throughput: {summary['per_second']:,.0f} schedules/s "
+          f"({summary['seconds']:.3f} s)")
+    return 1 if summary['invalid'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())